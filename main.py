@@ -9,6 +9,7 @@ import sys
 import time
 import random
 import json
+from collections import Counter
 from typing import List, Dict, Any
 
 # Add src directory to path for imports
@@ -21,7 +22,7 @@ from warehouse.structure import LargeWarehouse
 from utils.data_generator import WarehouseDataGenerator, WarehouseItem
 from agents.picker_swarm import PickerSwarmManager, PickOrder, OrderItem, PickerState
 from simulation.order_generator import RealisticOrderGenerator, Season
-from shared_enums import ItemSize, WeightClass, CellType, SeasonalPattern
+from shared_enums import ItemSize, WeightClass, SeasonalPattern
 
 class WarehouseSimulation:
     """Main simulation orchestrator"""
@@ -94,12 +95,9 @@ class WarehouseSimulation:
         
         # Print concise summary
         print(f"\nItem catalog summary:")
-        categories = {}
-        sizes = {}
-        for item in self.items:
-            categories[item.category] = categories.get(item.category, 0) + 1
-            size_str = item.size.value if hasattr(item.size, 'value') else str(item.size)
-            sizes[size_str] = sizes.get(size_str, 0) + 1
+        categories = Counter(item.category for item in self.items)
+        sizes = Counter(item.size.value if hasattr(item.size, 'value') else str(item.size)
+                        for item in self.items)
         
         print(f"  Categories: {dict(sorted(categories.items()))}")
         print(f"  Sizes: {dict(sorted(sizes.items()))}")
@@ -107,9 +105,8 @@ class WarehouseSimulation:
         frequencies = [item.base_daily_picks for item in self.items]
         print(f"  Pick frequency: {min(frequencies):.1f} - {max(frequencies):.1f} picks/day (avg: {sum(frequencies)/len(frequencies):.1f})")
         
-        # Show top 5 items
-        sorted_items = sorted(self.items, key=lambda x: x.base_daily_picks, reverse=True)
-        print(f"  Top items: {', '.join([item.name for item in sorted_items[:5]])}")
+        # Show top 5 items (generate_items returns them sorted by frequency, high to low)
+        print(f"  Top items: {', '.join([item.name for item in self.items[:5]])}")
         
         return self.items
         
@@ -126,11 +123,7 @@ class WarehouseSimulation:
         successful_placements = 0
         
         # Get all available shelf positions
-        shelf_positions = []
-        for x in range(self.warehouse.width):
-            for y in range(self.warehouse.depth):
-                if self.warehouse.get_cell_type(x, y) == CellType.SHELF:
-                    shelf_positions.append((x, y))
+        shelf_positions = self.warehouse.shelf_positions
         
         print(f"Found {len(shelf_positions)} shelf positions")
         print(f"Placing {len(self.items)} items using '{placement_strategy}' strategy...")
@@ -240,7 +233,7 @@ class WarehouseSimulation:
             return []
         
         # Create order generator
-        order_gen = RealisticOrderGenerator(available_items, random_seed=42)
+        order_gen = RealisticOrderGenerator(available_items, random_seed=42, verbose=True)
         order_gen.set_season(season)
         
         # Generate orders
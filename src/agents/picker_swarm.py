@@ -34,6 +34,9 @@ except ImportError:
 
 # Remove duplicate enum definitions since we now import from shared_enums
 
+# Load points each item size takes up on a picker (max 4 per trip)
+LOAD_POINTS = {ItemSize.SMALL: 1, ItemSize.MEDIUM: 2, ItemSize.LARGE: 4}
+
 @dataclass
 class OrderItem:
     """Single item in an order"""
@@ -60,13 +63,12 @@ class LoadCapacity:
     
     def can_carry(self, item: OrderItem) -> bool:
         """Check if picker can carry this item"""
-        item_points = {ItemSize.SMALL: 1, ItemSize.MEDIUM: 2, ItemSize.LARGE: 4}[item.size]
-        return self.load_points + item_points <= self.max_points
+        return self.load_points + LOAD_POINTS[item.size] <= self.max_points
     
     def add_item(self, item: OrderItem) -> bool:
         """Add item to load if possible"""
-        if self.can_carry(item):
-            item_points = {ItemSize.SMALL: 1, ItemSize.MEDIUM: 2, ItemSize.LARGE: 4}[item.size]
+        item_points = LOAD_POINTS[item.size]
+        if self.load_points + item_points <= self.max_points:
             self.items_carried.append(item)
             self.load_points += item_points
             return True
@@ -6,6 +6,12 @@ Single source of truth for all enum definitions
 
 from enum import Enum
 
+class IndexedEnum(Enum):
+    """Enum whose members carry their definition-order position as `index`"""
+    def __init__(self, *args):
+        # Members are registered in order, so the count so far is this member's row
+        self.index = len(type(self)._member_map_)
+
 class CellType(Enum):
     """Different types of warehouse cells"""
     AISLE = 0           # Regular aisle (walkable)
@@ -16,19 +22,19 @@ class CellType(Enum):
     CROSS_AISLE = 5     # Cross-connecting aisles
     WALL = 6            # Walls/blocked areas
 
-class ItemSize(Enum):
+class ItemSize(IndexedEnum):
     """Item size categories"""
     SMALL = "small"     # 4 items per cell
     MEDIUM = "medium"   # 2 items per cell  
     LARGE = "large"     # 1 item per cell
 
-class WeightClass(Enum):
+class WeightClass(IndexedEnum):
     """Weight classifications"""
     LIGHT = "light"     # Can go on any level (1-3)
     MEDIUM = "medium"   # Levels 1-2 only
     HEAVY = "heavy"     # Level 1 only
 
-class SeasonalPattern(Enum):
+class SeasonalPattern(IndexedEnum):
     """Seasonal demand patterns"""
     ALL_YEAR = "all_year"          # Consistent demand year-round
     WINTER_HEAVY = "winter_heavy"  # Peak in Dec-Feb
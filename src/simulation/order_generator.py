@@ -6,15 +6,17 @@ Creates daily orders with seasonal patterns, customer behavior, and realistic ti
 
 import random
 import math
+import numpy as np
 from typing import List, Dict, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime, time, timedelta
-from collections import defaultdict
+from collections import defaultdict, Counter
+from itertools import accumulate
 
 # Import shared enums
 try:
     from ..shared_enums import ItemSize, WeightClass, SeasonalPattern
-    from ..agents.picker_swarm import PickOrder, OrderItem
+    from ..agents.picker_swarm import PickOrder, OrderItem, LOAD_POINTS
 except ImportError:
     # Fallback for direct execution
     import sys
@@ -24,7 +26,29 @@ except ImportError:
     sys.path.insert(0, os.path.join(parent_dir, 'agents'))
     
     from shared_enums import ItemSize, WeightClass, SeasonalPattern
-    from picker_swarm import PickOrder, OrderItem
+    from picker_swarm import PickOrder, OrderItem, LOAD_POINTS
+
+# Season multipliers based on seasonal patterns (indexed by season - 1)
+SEASON_MULTIPLIERS = {
+    SeasonalPattern.ALL_YEAR: [1.0, 1.0, 1.0, 1.0],
+    SeasonalPattern.WINTER_HEAVY: [1.9, 0.8, 0.6, 1.0],
+    SeasonalPattern.SPRING_HEAVY: [0.8, 1.9, 0.8, 0.9],
+    SeasonalPattern.SUMMER_HEAVY: [0.6, 0.8, 1.9, 0.8],
+    SeasonalPattern.AUTUMN_HEAVY: [0.8, 0.9, 0.8, 1.9],
+    SeasonalPattern.HOLIDAY_PEAK: [1.8, 0.9, 0.8, 1.1],
+    SeasonalPattern.BACK_TO_SCHOOL: [0.8, 1.0, 1.2, 2.0]
+}
+
+# Category-based adjustments for realistic combinations
+CATEGORY_BOOSTS = {
+    'electronics': 1.2,  # Popular category
+    'clothing': 1.1,
+    'books': 0.9,
+    'tools': 0.8,
+    'home_garden': 0.7,
+    'sports': 0.8,
+    'kitchen': 1.0
+}
 
 class Season:
     """Current season for demand calculation"""
@@ -40,7 +64,7 @@ class CustomerType:
     BUSINESS = "business"         # Larger, bulk orders (4-12 items)
     EMERGENCY = "emergency"       # Single item, high priority
 
-@dataclass
+@dataclass(slots=True)
 class OrderPattern:
     """Order generation pattern definition"""
     customer_type: str
@@ -53,28 +77,64 @@ class OrderPattern:
 class RealisticOrderGenerator:
     """Generate realistic warehouse orders with seasonal patterns and customer behavior"""
     
-    def __init__(self, placed_items: List[Dict], random_seed: int = None):
+    def __init__(self, placed_items: List[Dict], random_seed: int = None, verbose: bool = False):
         """
         Initialize order generator
         
         Args:
             placed_items: List of item dictionaries from warehouse simulation
             random_seed: Optional seed for reproducible results
+            verbose: Print progress and order statistics (off for batch runs)
         """
         if random_seed:
             random.seed(random_seed)
         
+        self.verbose = verbose
         self.placed_items = placed_items
         self.current_season = Season.AUTUMN  # Default season
         
         # Create order patterns for different customer types
         self.order_patterns = self._create_order_patterns()
         
+        # Pattern parameters as arrays (same order as order_patterns) for batch sampling
+        self._customer_types = list(self.order_patterns.keys())
+        patterns = list(self.order_patterns.values())
+        self._min_items = np.array([p.min_items for p in patterns])
+        self._max_items = np.array([p.max_items for p in patterns])
+        self._priority_cdf = np.cumsum([p.priority_distribution for p in patterns], axis=1, dtype=float)
+        self._priority_cdf /= self._priority_cdf[:, -1:]
+        self._rng = np.random.default_rng(random_seed)
+        self._type_index = {ctype: i for i, ctype in enumerate(self._customer_types)}
+        
+        # Cumulative customer type probabilities per (weekday=0/weekend=1, hour)
+        ctype_weights = np.array([[self._customer_type_weights(hour, day_of_week) for hour in range(24)]
+                                  for day_of_week in (1, 6)])
+        self._ctype_cdf = np.cumsum(ctype_weights, axis=2)
+        self._ctype_cdf /= self._ctype_cdf[:, :, -1:]
+        
+        # Item attributes as arrays for vectorized pool weighting
+        self._size_index = {size: i for i, size in enumerate(ItemSize)}
+        self._size_preferences = np.array([[p.size_preference.get(size, 0.1) for size in ItemSize]
+                                           for p in patterns])
+        self._item_size_idx = np.array([self._size_index[item['size']] for item in placed_items], dtype=int)
+        self._item_picks = np.array([item['daily_picks'] for item in placed_items], dtype=float)
+        self._item_season_multipliers = np.array(
+            [SEASON_MULTIPLIERS.get(item['seasonal_pattern'], [1.0] * 4) for item in placed_items],
+            dtype=float).reshape(-1, 4)
+        self._item_category_boosts = np.array(
+            [CATEGORY_BOOSTS.get(item['category'], 1.0) for item in placed_items], dtype=float)
+        self._pool_weights = self._compute_pool_weights()
+        self._pool_weights_season = self.current_season  # Season _pool_weights was built for
+        
         # Create item lookup for quick access
         self.items_by_category = self._group_items_by_category()
         self.items_by_frequency = self._sort_items_by_frequency()
         
-        print(f"Order generator initialized with {len(placed_items)} available items")
+        # Weighted item pools, with their cumulative weights, depend only on (season, customer type)
+        self._pool_cache: Dict[Tuple[int, str], Tuple[List[Tuple[Dict, float]], List[float]]] = {}
+        
+        if self.verbose:
+            print(f"Order generator initialized with {len(placed_items)} available items")
     
     def _create_order_patterns(self) -> Dict[str, OrderPattern]:
         """Define realistic order patterns for different customer types"""
@@ -118,10 +178,15 @@ class RealisticOrderGenerator:
     
     def _group_items_by_category(self) -> Dict[str, List[Dict]]:
         """Group items by category for realistic order composition"""
-        categories = defaultdict(list)
+        # Count first so each bucket is allocated once at its final size
+        counts = Counter(item['category'] for item in self.placed_items)
+        categories = {category: [None] * count for category, count in counts.items()}
+        fill_idx = defaultdict(int)
         for item in self.placed_items:
-            categories[item['category']].append(item)
-        return dict(categories)
+            category = item['category']
+            categories[category][fill_idx[category]] = item
+            fill_idx[category] += 1
+        return categories
     
     def _sort_items_by_frequency(self) -> List[Dict]:
         """Sort items by daily pick frequency for popularity-based selection"""
@@ -130,30 +195,37 @@ class RealisticOrderGenerator:
     def set_season(self, season: int):
         """Set current season (1=Winter, 2=Spring, 3=Summer, 4=Autumn)"""
         self.current_season = season
-        print(f"Season set to: {['Winter', 'Spring', 'Summer', 'Autumn'][season-1]}")
+        self._pool_weights = self._compute_pool_weights()
+        self._pool_weights_season = season
+        self._pool_cache.clear()
+        if self.verbose:
+            print(f"Season set to: {['Winter', 'Spring', 'Summer', 'Autumn'][season-1]}")
     
     def calculate_seasonal_demand(self, item: Dict) -> float:
         """Calculate item demand based on current season"""
         base_demand = item['daily_picks']
         seasonal_pattern = item['seasonal_pattern']
         
-        # Season multipliers based on seasonal patterns
-        season_multipliers = {
-            SeasonalPattern.ALL_YEAR: [1.0, 1.0, 1.0, 1.0],
-            SeasonalPattern.WINTER_HEAVY: [1.9, 0.8, 0.6, 1.0],
-            SeasonalPattern.SPRING_HEAVY: [0.8, 1.9, 0.8, 0.9],
-            SeasonalPattern.SUMMER_HEAVY: [0.6, 0.8, 1.9, 0.8],
-            SeasonalPattern.AUTUMN_HEAVY: [0.8, 0.9, 0.8, 1.9],
-            SeasonalPattern.HOLIDAY_PEAK: [1.8, 0.9, 0.8, 1.1],
-            SeasonalPattern.BACK_TO_SCHOOL: [0.8, 1.0, 1.2, 2.0]
-        }
-        
-        if seasonal_pattern in season_multipliers:
-            multiplier = season_multipliers[seasonal_pattern][self.current_season - 1]
+        if seasonal_pattern in SEASON_MULTIPLIERS:
+            multiplier = SEASON_MULTIPLIERS[seasonal_pattern][self.current_season - 1]
             return base_demand * multiplier
         
         return base_demand
     
+    def _compute_pool_weights(self) -> np.ndarray:
+        """Item pool weights for the current season, shape (num_customer_types, num_items)"""
+        # Base weight from seasonal demand
+        seasonal_demand = self._item_picks * self._item_season_multipliers[:, self.current_season - 1]
+        
+        # Apply size preference per customer type
+        weights = seasonal_demand * self._size_preferences[:, self._item_size_idx]
+        
+        # Boost popular items, then apply category adjustments
+        weights *= np.where(seasonal_demand > 10, 1.5, 1.0)
+        weights *= self._item_category_boosts
+        
+        return np.maximum(weights, 0.1)  # Minimum weight
+    
     def generate_daily_orders(self, 
                             num_orders: int = None,
                             day_of_week: int = 1,
@@ -174,29 +246,39 @@ class RealisticOrderGenerator:
             # Calculate realistic daily order volume
             num_orders = self._calculate_daily_order_volume(day_of_week, special_events)
         
-        print(f"Generating {num_orders} orders for day {day_of_week} ({['Mon','Tue','Wed','Thu','Fri','Sat','Sun'][day_of_week-1]})")
+        if self.verbose:
+            print(f"Generating {num_orders} orders for day {day_of_week} ({['Mon','Tue','Wed','Thu','Fri','Sat','Sun'][day_of_week-1]})")
         
         orders = []
         
         # Generate orders throughout the day
         order_times = self._generate_order_times(num_orders, day_of_week)
         
+        # Draw customer types, item counts and priorities for the whole day at once
+        n = len(order_times)
+        hours = np.array([int(t[:2]) for t in order_times], dtype=int)
+        hour_cdf = self._ctype_cdf[int(day_of_week > 5)]
+        customer_idx = (self._rng.random(n)[:, None] < hour_cdf[hours]).argmax(axis=1)
+        item_counts = self._rng.integers(self._min_items[customer_idx],
+                                         self._max_items[customer_idx], endpoint=True)
+        priorities = (self._rng.random(n)[:, None] >= self._priority_cdf[customer_idx]).sum(axis=1) + 1
+        
         for i, order_time in enumerate(order_times):
-            # Select customer type based on time and patterns
-            customer_type = self._select_customer_type(order_time, day_of_week)
-            
             # Generate order for this customer type
             order = self._generate_single_order(
                 order_id=f"ORD_{i+1:03d}",
-                customer_type=customer_type,
-                order_time=order_time
+                customer_type=self._customer_types[customer_idx[i]],
+                order_time=order_time,
+                num_items=int(item_counts[i]),
+                priority=int(priorities[i])
             )
             
             if order and order.items:  # Only add non-empty orders
                 orders.append(order)
         
-        print(f"Generated {len(orders)} valid orders")
-        self._print_order_statistics(orders)
+        if self.verbose:
+            print(f"Generated {len(orders)} valid orders")
+            self._print_order_statistics(orders)
         
         return orders
     
@@ -247,7 +329,7 @@ class RealisticOrderGenerator:
     
     def _generate_order_times(self, num_orders: int, day_of_week: int) -> List[str]:
         """Generate realistic order times throughout the day"""
-        times = []
+        minutes_of_day = []
         
         # Define peak hours (more orders during these times)
         if day_of_week <= 5:  # Weekday
@@ -266,17 +348,14 @@ class RealisticOrderGenerator:
                 hour = random.randint(8, 21)
             
             minute = random.randint(0, 59)
-            time_str = f"{hour:02d}:{minute:02d}:00"
-            times.append(time_str)
+            minutes_of_day.append(hour * 60 + minute)
         
-        # Sort times chronologically
-        times.sort()
-        return times
+        # Sort chronologically on integer minutes, then format once
+        minutes_of_day.sort()
+        return [f"{m // 60:02d}:{m % 60:02d}:00" for m in minutes_of_day]
     
-    def _select_customer_type(self, order_time: str, day_of_week: int) -> str:
-        """Select customer type based on time and day patterns"""
-        hour = int(order_time.split(':')[0])
-        
+    def _customer_type_weights(self, hour: int, day_of_week: int) -> List[float]:
+        """Unnormalized customer type weights for an hour of the day"""
         # Adjust customer type probabilities based on time
         base_weights = [p.frequency_weight for p in self.order_patterns.values()]
         
@@ -292,24 +371,13 @@ class RealisticOrderGenerator:
         else:
             weights = base_weights
         
-        # Normalize weights
-        total_weight = sum(weights)
-        probabilities = [w / total_weight for w in weights]
-        
-        # Select customer type
-        customer_types = list(self.order_patterns.keys())
-        return random.choices(customer_types, weights=probabilities)[0]
+        return weights
     
-    def _generate_single_order(self, order_id: str, customer_type: str, order_time: str) -> PickOrder:
-        """Generate a single order for given customer type"""
+    def _generate_single_order(self, order_id: str, customer_type: str, order_time: str,
+                               num_items: int, priority: int) -> PickOrder:
+        """Generate a single order for given customer type with a pre-drawn item count and priority"""
         pattern = self.order_patterns[customer_type]
         
-        # Determine number of items
-        num_items = random.randint(pattern.min_items, pattern.max_items)
-        
-        # Select priority
-        priority = random.choices([1, 2, 3], weights=pattern.priority_distribution)[0]
-        
         # Select items for this order
         order_items = self._select_order_items(num_items, pattern)
         
@@ -335,7 +403,7 @@ class RealisticOrderGenerator:
         used_item_ids = set()
         
         # Create weighted item pool based on seasonal demand and size preference
-        weighted_items = self._create_weighted_item_pool(pattern)
+        weighted_items, cum_weights = self._create_weighted_item_pool(pattern)
         
         attempts = 0
         max_attempts = num_items * 10
@@ -344,14 +412,14 @@ class RealisticOrderGenerator:
             attempts += 1
             
             # Select item based on weights
-            item_data = random.choices(weighted_items, weights=[w for _, w in weighted_items])[0][0]
+            item_data = random.choices(weighted_items, cum_weights=cum_weights)[0][0]
             
             # Skip if already selected
             if item_data['item_id'] in used_item_ids:
                 continue
             
             # Check load capacity
-            item_points = {ItemSize.SMALL: 1, ItemSize.MEDIUM: 2, ItemSize.LARGE: 4}[item_data['size']]
+            item_points = LOAD_POINTS[item_data['size']]
             
             if total_load_points + item_points <= max_load_points:
                 # Create order item
@@ -369,40 +437,23 @@ class RealisticOrderGenerator:
         
         return selected_items
     
-    def _create_weighted_item_pool(self, pattern: OrderPattern) -> List[Tuple[Dict, float]]:
-        """Create weighted pool of items based on pattern preferences and seasonal demand"""
-        weighted_items = []
-        
-        for item in self.placed_items:
-            # Base weight from seasonal demand
-            seasonal_demand = self.calculate_seasonal_demand(item)
-            base_weight = seasonal_demand
-            
-            # Apply size preference
-            size_preference = pattern.size_preference.get(item['size'], 0.1)
-            weight = base_weight * size_preference
-            
-            # Boost popular items
-            if seasonal_demand > 10:  # High-demand items
-                weight *= 1.5
-            
-            # Category-based adjustments for realistic combinations
-            category_boosts = {
-                'electronics': 1.2,  # Popular category
-                'clothing': 1.1,
-                'books': 0.9,
-                'tools': 0.8,
-                'home_garden': 0.7,
-                'sports': 0.8,
-                'kitchen': 1.0
-            }
-            
-            category_boost = category_boosts.get(item['category'], 1.0)
-            weight *= category_boost
-            
-            weighted_items.append((item, max(0.1, weight)))  # Minimum weight
-        
-        return weighted_items
+    def _create_weighted_item_pool(self, pattern: OrderPattern) -> Tuple[List[Tuple[Dict, float]], List[float]]:
+        """Create weighted pool of items based on pattern preferences and seasonal demand, with cumulative weights"""
+        key = (self.current_season, pattern.customer_type)
+        if key in self._pool_cache:
+            return self._pool_cache[key]
+        
+        # current_season may have been assigned directly rather than through set_season
+        if self._pool_weights_season != self.current_season:
+            self._pool_weights = self._compute_pool_weights()
+            self._pool_weights_season = self.current_season
+        
+        weights = self._pool_weights[self._type_index[pattern.customer_type]]
+        weighted_items = list(zip(self.placed_items, weights.tolist()))
+        
+        # Cumulative weights let random.choices skip re-summing the pool on every draw
+        self._pool_cache[key] = weighted_items, list(accumulate(w for _, w in weighted_items))
+        return self._pool_cache[key]
     
     def _print_order_statistics(self, orders: List[PickOrder]):
         """Print statistics about generated orders"""
@@ -413,30 +464,31 @@ class RealisticOrderGenerator:
         avg_items = total_items / len(orders)
         
         # Count by priority
-        priority_counts = {1: 0, 2: 0, 3: 0}
-        for order in orders:
-            priority_counts[order.priority] += 1
+        priorities = np.fromiter((order.priority for order in orders), dtype=int, count=len(orders))
+        priority_counts = np.bincount(priorities, minlength=4)
         
         # Count by size
-        size_counts = {ItemSize.SMALL: 0, ItemSize.MEDIUM: 0, ItemSize.LARGE: 0}
-        for order in orders:
-            for item in order.items:
-                size_counts[item.size] += 1
+        size_codes = np.fromiter((self._size_index[item.size] for order in orders for item in order.items),
+                                 dtype=int, count=total_items)
+        size_counts = np.bincount(size_codes, minlength=len(self._size_index))
+        small, medium, large = (size_counts[self._size_index[size]]
+                                for size in (ItemSize.SMALL, ItemSize.MEDIUM, ItemSize.LARGE))
         
         print(f"\nOrder Statistics:")
         print(f"  Total orders: {len(orders)}")
         print(f"  Total items: {total_items}")
         print(f"  Average items per order: {avg_items:.1f}")
         print(f"  Priority distribution: Normal={priority_counts[1]}, High={priority_counts[2]}, Urgent={priority_counts[3]}")
-        print(f"  Size distribution: Small={size_counts[ItemSize.SMALL]}, Medium={size_counts[ItemSize.MEDIUM]}, Large={size_counts[ItemSize.LARGE]}")
+        print(f"  Size distribution: Small={small}, Medium={medium}, Large={large}")
     
     def generate_weekly_orders(self, special_events: List[str] = None) -> Dict[int, List[PickOrder]]:
         """Generate orders for a full week (7 days)"""
         weekly_orders = {}
         
         for day in range(1, 8):  # Monday to Sunday
-            day_name = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'][day-1]
-            print(f"\nGenerating orders for {day_name}...")
+            if self.verbose:
+                day_name = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'][day-1]
+                print(f"\nGenerating orders for {day_name}...")
             
             daily_orders = self.generate_daily_orders(
                 day_of_week=day,
@@ -444,13 +496,14 @@ class RealisticOrderGenerator:
             )
             weekly_orders[day] = daily_orders
         
-        total_orders = sum(len(orders) for orders in weekly_orders.values())
-        total_items = sum(sum(len(order.items) for order in orders) for orders in weekly_orders.values())
-        
-        print(f"\nWeekly Summary:")
-        print(f"  Total orders: {total_orders}")
-        print(f"  Total items: {total_items}")
-        print(f"  Average orders per day: {total_orders/7:.1f}")
+        if self.verbose:
+            total_orders = sum(len(orders) for orders in weekly_orders.values())
+            total_items = sum(sum(len(order.items) for order in orders) for orders in weekly_orders.values())
+            
+            print(f"\nWeekly Summary:")
+            print(f"  Total orders: {total_orders}")
+            print(f"  Total items: {total_items}")
+            print(f"  Average orders per day: {total_orders/7:.1f}")
         
         return weekly_orders
 
@@ -482,7 +535,7 @@ def demo_order_generator():
     print(f"Created {len(sample_items)} sample items for demonstration")
     
     # Create order generator
-    order_gen = RealisticOrderGenerator(sample_items, random_seed=42)
+    order_gen = RealisticOrderGenerator(sample_items, random_seed=42, verbose=True)
     
     # Test different seasons
     seasons = [Season.WINTER, Season.SPRING, Season.SUMMER, Season.AUTUMN]
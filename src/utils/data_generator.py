@@ -7,11 +7,19 @@ Creates realistic warehouse items with seasonal patterns, frequencies, and chara
 import json
 import random
 import math
-from typing import List, Dict, Any
-from dataclasses import dataclass, asdict
+from collections import Counter
+import numpy as np
+from typing import List, Dict, Any, NamedTuple
+from dataclasses import dataclass
 import csv
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:
+    # Optional fast encoder; fall back to the stdlib json module
+    orjson = None
+
 # Import shared enums
 try:
     from ..shared_enums import ItemSize, WeightClass, SeasonalPattern
@@ -23,7 +31,42 @@ except ImportError:
     sys.path.insert(0, parent_dir)
     from shared_enums import ItemSize, WeightClass, SeasonalPattern
 
-@dataclass
+# Seasonal demand multipliers by month (columns Jan..Dec), row SeasonalPattern.index
+_SEASONAL_FACTORS = (
+    (1.0,) * 12,                                                     # ALL_YEAR
+    (1.8, 1.9, 1.2, 0.8, 0.7, 0.6, 0.6, 0.7, 0.8, 1.0, 1.3, 1.7),    # WINTER_HEAVY
+    (0.8, 0.7, 1.5, 1.8, 1.9, 1.2, 0.8, 0.7, 0.8, 1.0, 1.1, 0.9),    # SPRING_HEAVY
+    (0.7, 0.6, 0.8, 1.2, 1.5, 1.9, 1.8, 1.6, 1.0, 0.8, 0.7, 0.6),    # SUMMER_HEAVY
+    (0.8, 0.7, 0.8, 0.9, 1.0, 0.8, 0.7, 1.2, 1.8, 1.9, 1.5, 1.0),    # AUTUMN_HEAVY
+    (0.9, 0.8, 0.8, 0.9, 0.9, 0.8, 0.8, 0.9, 1.0, 1.1, 1.8, 2.2),    # HOLIDAY_PEAK
+    (0.9, 0.8, 0.8, 0.9, 0.9, 1.0, 1.2, 2.0, 1.8, 1.0, 0.9, 0.8),    # BACK_TO_SCHOOL
+)
+
+# Monthly factor function per pattern, indexed by SeasonalPattern.index; a pattern that
+# needs its own formula (rather than a table row) can swap in any callable month -> factor
+_PATTERN_FNS = (lambda month: 1.0,) + tuple(
+    (lambda month, row=row: row[month - 1]) for row in _SEASONAL_FACTORS[1:]
+)
+
+# Peak seasonal multiplier per pattern, indexed by SeasonalPattern.index
+_SEASONAL_MULTIPLIERS = (1.0, 1.9, 1.9, 1.9, 1.9, 2.2, 2.0)
+
+# Popularity rank by base frequency bucket (np.digitize against _POPULARITY_BINS)
+_POPULARITY_BINS = (5.0, 10.0)
+_POPULARITY_RANKS = ("low", "medium", "high")
+
+# Same table as an array for whole-catalog calculations
+SEASONAL_FACTORS = np.array(_SEASONAL_FACTORS, dtype=np.float64)
+
+
+def daily_picks_batch(base: np.ndarray, season_idx: np.ndarray, months: np.ndarray,
+                      factors: np.ndarray = SEASONAL_FACTORS) -> np.ndarray:
+    """Daily picks for N items over M months (1=Jan), returns an (N, M) float64 matrix"""
+    months = np.asarray(months, dtype=np.intp)
+    season_idx = np.asarray(season_idx, dtype=np.intp)
+    return np.asarray(base, dtype=np.float64)[:, None] * factors[season_idx[:, None], months - 1]
+
+@dataclass(slots=True)
 class WarehouseItem:
     """Complete warehouse item definition"""
     id: str
@@ -40,21 +83,139 @@ class WarehouseItem:
     
     def get_daily_picks_for_month(self, month: int) -> float:
         """Calculate daily picks for given month (1=Jan, 12=Dec)"""
-        base_picks = self.base_daily_picks
-        
-        # Define seasonal multipliers by month
-        seasonal_factors = {
-            SeasonalPattern.ALL_YEAR: [1.0] * 12,
-            SeasonalPattern.WINTER_HEAVY: [1.8, 1.9, 1.2, 0.8, 0.7, 0.6, 0.6, 0.7, 0.8, 1.0, 1.3, 1.7],
-            SeasonalPattern.SPRING_HEAVY: [0.8, 0.7, 1.5, 1.8, 1.9, 1.2, 0.8, 0.7, 0.8, 1.0, 1.1, 0.9],
-            SeasonalPattern.SUMMER_HEAVY: [0.7, 0.6, 0.8, 1.2, 1.5, 1.9, 1.8, 1.6, 1.0, 0.8, 0.7, 0.6],
-            SeasonalPattern.AUTUMN_HEAVY: [0.8, 0.7, 0.8, 0.9, 1.0, 0.8, 0.7, 1.2, 1.8, 1.9, 1.5, 1.0],
-            SeasonalPattern.HOLIDAY_PEAK: [0.9, 0.8, 0.8, 0.9, 0.9, 0.8, 0.8, 0.9, 1.0, 1.1, 1.8, 2.2],
-            SeasonalPattern.BACK_TO_SCHOOL: [0.9, 0.8, 0.8, 0.9, 0.9, 1.0, 1.2, 2.0, 1.8, 1.0, 0.9, 0.8]
-        }
-        
-        factor = seasonal_factors[self.seasonal_pattern][month - 1]
-        return base_picks * factor
+        if not 1 <= month <= 12:
+            raise ValueError(f"Month must be 1-12, got {month}")
+        return self.base_daily_picks * _PATTERN_FNS[self.seasonal_pattern.index](month)
+
+
+def _json_record(item: WarehouseItem) -> Dict[str, Any]:
+    """Plain dict for the items JSON (enums as their string values), built without asdict"""
+    return {
+        "id": item.id,
+        "name": item.name,
+        "category": item.category,
+        "size": item.size.value,
+        "weight_class": item.weight_class.value,
+        "base_daily_picks": item.base_daily_picks,
+        "seasonal_pattern": item.seasonal_pattern.value,
+        "seasonal_multiplier": item.seasonal_multiplier,
+        "unit_cost": item.unit_cost,
+        "storage_requirements": item.storage_requirements,
+        "popularity_rank": item.popularity_rank
+    }
+
+
+def _csv_row(item: WarehouseItem) -> tuple:
+    """Format one item as a row of the items CSV"""
+    return (
+        item.id,
+        item.name,
+        item.category,
+        item.size.value,
+        item.weight_class.value,
+        format(item.base_daily_picks, '.2f'),
+        item.seasonal_pattern.value,
+        format(item.seasonal_multiplier, '.2f'),
+        '$' + format(item.unit_cost, '.2f'),
+        item.popularity_rank,
+        '; '.join(item.storage_requirements)
+    )
+
+
+class _Tmpl(NamedTuple):
+    """Base item template; generated items cycle through their category's templates"""
+    name: str
+    size: ItemSize
+    weight: WeightClass
+    freq: float
+    season: SeasonalPattern
+    cost: float
+    winter_name: bool = False  # "winter" appears in the name (set below)
+
+
+# Item templates with realistic characteristics, as (category, templates) pairs
+_ITEM_TEMPLATES = (
+    # Electronics - High frequency, light/medium weight, small/medium size
+    ("electronics", (
+        _Tmpl("Laptop Computer", ItemSize.MEDIUM, WeightClass.MEDIUM, 12.5, SeasonalPattern.BACK_TO_SCHOOL, 899.99),
+        _Tmpl("Smartphone", ItemSize.SMALL, WeightClass.LIGHT, 15.2, SeasonalPattern.ALL_YEAR, 699.99),
+        _Tmpl("Tablet Device", ItemSize.SMALL, WeightClass.LIGHT, 8.3, SeasonalPattern.HOLIDAY_PEAK, 329.99),
+        _Tmpl("Wireless Headphones", ItemSize.SMALL, WeightClass.LIGHT, 18.7, SeasonalPattern.ALL_YEAR, 199.99),
+        _Tmpl("Gaming Console", ItemSize.MEDIUM, WeightClass.MEDIUM, 6.4, SeasonalPattern.HOLIDAY_PEAK, 499.99),
+        _Tmpl("Smart Watch", ItemSize.SMALL, WeightClass.LIGHT, 9.1, SeasonalPattern.ALL_YEAR, 399.99),
+        _Tmpl("Bluetooth Speaker", ItemSize.SMALL, WeightClass.LIGHT, 11.8, SeasonalPattern.SUMMER_HEAVY, 89.99),
+        _Tmpl("Webcam", ItemSize.SMALL, WeightClass.LIGHT, 4.2, SeasonalPattern.BACK_TO_SCHOOL, 79.99),
+    )),
+    
+    # Home & Garden - Seasonal patterns, various sizes
+    ("home_garden", (
+        _Tmpl("Space Heater", ItemSize.MEDIUM, WeightClass.MEDIUM, 3.8, SeasonalPattern.WINTER_HEAVY, 149.99),
+        _Tmpl("Air Conditioner", ItemSize.LARGE, WeightClass.HEAVY, 2.1, SeasonalPattern.SUMMER_HEAVY, 299.99),
+        _Tmpl("Garden Hose", ItemSize.MEDIUM, WeightClass.MEDIUM, 5.3, SeasonalPattern.SPRING_HEAVY, 34.99),
+        _Tmpl("Lawn Mower", ItemSize.LARGE, WeightClass.HEAVY, 1.8, SeasonalPattern.SPRING_HEAVY, 449.99),
+        _Tmpl("Christmas Lights", ItemSize.SMALL, WeightClass.LIGHT, 0.5, SeasonalPattern.HOLIDAY_PEAK, 24.99),
+        _Tmpl("Patio Furniture Set", ItemSize.LARGE, WeightClass.HEAVY, 1.2, SeasonalPattern.SPRING_HEAVY, 599.99),
+        _Tmpl("Snow Shovel", ItemSize.MEDIUM, WeightClass.MEDIUM, 2.7, SeasonalPattern.WINTER_HEAVY, 29.99),
+        _Tmpl("Barbecue Grill", ItemSize.LARGE, WeightClass.HEAVY, 1.9, SeasonalPattern.SUMMER_HEAVY, 399.99),
+    )),
+    
+    # Clothing & Fashion - Seasonal, light weight, small/medium
+    ("clothing", (
+        _Tmpl("Winter Coat", ItemSize.MEDIUM, WeightClass.LIGHT, 4.6, SeasonalPattern.WINTER_HEAVY, 129.99),
+        _Tmpl("Summer Dress", ItemSize.SMALL, WeightClass.LIGHT, 7.2, SeasonalPattern.SUMMER_HEAVY, 59.99),
+        _Tmpl("Running Shoes", ItemSize.SMALL, WeightClass.LIGHT, 13.4, SeasonalPattern.ALL_YEAR, 119.99),
+        _Tmpl("Jeans", ItemSize.SMALL, WeightClass.LIGHT, 16.8, SeasonalPattern.ALL_YEAR, 79.99),
+        _Tmpl("Sweater", ItemSize.SMALL, WeightClass.LIGHT, 6.9, SeasonalPattern.AUTUMN_HEAVY, 49.99),
+        _Tmpl("Swimwear", ItemSize.SMALL, WeightClass.LIGHT, 3.1, SeasonalPattern.SUMMER_HEAVY, 39.99),
+        _Tmpl("School Backpack", ItemSize.MEDIUM, WeightClass.LIGHT, 5.7, SeasonalPattern.BACK_TO_SCHOOL, 49.99),
+    )),
+    
+    # Sports & Outdoors - Seasonal, various sizes and weights
+    ("sports", (
+        _Tmpl("Ski Equipment Set", ItemSize.LARGE, WeightClass.HEAVY, 1.4, SeasonalPattern.WINTER_HEAVY, 799.99),
+        _Tmpl("Bicycle", ItemSize.LARGE, WeightClass.HEAVY, 3.6, SeasonalPattern.SPRING_HEAVY, 599.99),
+        _Tmpl("Tennis Racket", ItemSize.MEDIUM, WeightClass.LIGHT, 4.8, SeasonalPattern.SUMMER_HEAVY, 149.99),
+        _Tmpl("Camping Tent", ItemSize.MEDIUM, WeightClass.MEDIUM, 2.9, SeasonalPattern.SUMMER_HEAVY, 199.99),
+        _Tmpl("Yoga Mat", ItemSize.MEDIUM, WeightClass.LIGHT, 8.1, SeasonalPattern.ALL_YEAR, 29.99),
+        _Tmpl("Football", ItemSize.SMALL, WeightClass.LIGHT, 6.3, SeasonalPattern.AUTUMN_HEAVY, 24.99),
+        _Tmpl("Golf Club Set", ItemSize.LARGE, WeightClass.HEAVY, 2.2, SeasonalPattern.SPRING_HEAVY, 899.99),
+    )),
+    
+    # Books & Education - Back to school heavy, light weight
+    ("books", (
+        _Tmpl("Textbook Mathematics", ItemSize.SMALL, WeightClass.LIGHT, 7.5, SeasonalPattern.BACK_TO_SCHOOL, 199.99),
+        _Tmpl("Novel Fiction", ItemSize.SMALL, WeightClass.LIGHT, 12.3, SeasonalPattern.ALL_YEAR, 14.99),
+        _Tmpl("Children's Book Set", ItemSize.SMALL, WeightClass.LIGHT, 8.7, SeasonalPattern.HOLIDAY_PEAK, 39.99),
+        _Tmpl("Professional Manual", ItemSize.MEDIUM, WeightClass.LIGHT, 3.4, SeasonalPattern.ALL_YEAR, 89.99),
+        _Tmpl("Art Supplies Kit", ItemSize.MEDIUM, WeightClass.LIGHT, 5.6, SeasonalPattern.BACK_TO_SCHOOL, 79.99),
+        _Tmpl("Calculator Scientific", ItemSize.SMALL, WeightClass.LIGHT, 4.1, SeasonalPattern.BACK_TO_SCHOOL, 129.99),
+    )),
+    
+    # Tools & Hardware - Medium frequency, heavy items
+    ("tools", (
+        _Tmpl("Power Drill", ItemSize.MEDIUM, WeightClass.MEDIUM, 6.8, SeasonalPattern.SPRING_HEAVY, 199.99),
+        _Tmpl("Tool Box Set", ItemSize.LARGE, WeightClass.HEAVY, 4.2, SeasonalPattern.ALL_YEAR, 299.99),
+        _Tmpl("Hammer", ItemSize.SMALL, WeightClass.MEDIUM, 9.1, SeasonalPattern.ALL_YEAR, 24.99),
+        _Tmpl("Screwdriver Set", ItemSize.SMALL, WeightClass.LIGHT, 11.6, SeasonalPattern.ALL_YEAR, 39.99),
+        _Tmpl("Chainsaw", ItemSize.LARGE, WeightClass.HEAVY, 1.7, SeasonalPattern.AUTUMN_HEAVY, 399.99),
+        _Tmpl("Work Gloves", ItemSize.SMALL, WeightClass.LIGHT, 14.2, SeasonalPattern.ALL_YEAR, 12.99),
+    )),
+    
+    # Kitchen & Appliances - Holiday peaks, various sizes
+    ("kitchen", (
+        _Tmpl("Coffee Machine", ItemSize.MEDIUM, WeightClass.MEDIUM, 7.9, SeasonalPattern.ALL_YEAR, 149.99),
+        _Tmpl("Microwave Oven", ItemSize.LARGE, WeightClass.HEAVY, 3.8, SeasonalPattern.ALL_YEAR, 199.99),
+        _Tmpl("Blender", ItemSize.MEDIUM, WeightClass.MEDIUM, 5.4, SeasonalPattern.ALL_YEAR, 89.99),
+        _Tmpl("Cookie Cutters Set", ItemSize.SMALL, WeightClass.LIGHT, 2.1, SeasonalPattern.HOLIDAY_PEAK, 19.99),
+        _Tmpl("Stand Mixer", ItemSize.LARGE, WeightClass.HEAVY, 2.7, SeasonalPattern.HOLIDAY_PEAK, 399.99),
+    )),
+)
+
+# Flag winter-named templates once so generation never lowercases names
+_ITEM_TEMPLATES = tuple(
+    (category, tuple(t._replace(winter_name="winter" in t.name.lower()) for t in templates))
+    for category, templates in _ITEM_TEMPLATES
+)
 
 
 class WarehouseDataGenerator:
@@ -63,123 +224,48 @@ class WarehouseDataGenerator:
     def __init__(self, random_seed: int = 42):
         """Initialize data generator with optional random seed for reproducibility"""
         random.seed(random_seed)
+        self._rng = np.random.default_rng(random_seed)
         self.items: List[WarehouseItem] = []
+        self._cols: Dict[str, Any] = {}
+        self._seasonal_mask = np.zeros(0, dtype=bool)
+        self._by_category: Dict[str, List[WarehouseItem]] = {}
         
         # Item templates with realistic characteristics
-        self.item_templates = self._create_item_templates()
-    
-    def _create_item_templates(self) -> List[Dict[str, Any]]:
-        """Create realistic item templates for different categories"""
-        return [
-            # Electronics - High frequency, light/medium weight, small/medium size
-            {
-                "category": "electronics",
-                "items": [
-                    {"name": "Laptop Computer", "size": ItemSize.MEDIUM, "weight": WeightClass.MEDIUM, "freq": 12.5, "season": SeasonalPattern.BACK_TO_SCHOOL, "cost": 899.99},
-                    {"name": "Smartphone", "size": ItemSize.SMALL, "weight": WeightClass.LIGHT, "freq": 15.2, "season": SeasonalPattern.ALL_YEAR, "cost": 699.99},
-                    {"name": "Tablet Device", "size": ItemSize.SMALL, "weight": WeightClass.LIGHT, "freq": 8.3, "season": SeasonalPattern.HOLIDAY_PEAK, "cost": 329.99},
-                    {"name": "Wireless Headphones", "size": ItemSize.SMALL, "weight": WeightClass.LIGHT, "freq": 18.7, "season": SeasonalPattern.ALL_YEAR, "cost": 199.99},
-                    {"name": "Gaming Console", "size": ItemSize.MEDIUM, "weight": WeightClass.MEDIUM, "freq": 6.4, "season": SeasonalPattern.HOLIDAY_PEAK, "cost": 499.99},
-                    {"name": "Smart Watch", "size": ItemSize.SMALL, "weight": WeightClass.LIGHT, "freq": 9.1, "season": SeasonalPattern.ALL_YEAR, "cost": 399.99},
-                    {"name": "Bluetooth Speaker", "size": ItemSize.SMALL, "weight": WeightClass.LIGHT, "freq": 11.8, "season": SeasonalPattern.SUMMER_HEAVY, "cost": 89.99},
-                    {"name": "Webcam", "size": ItemSize.SMALL, "weight": WeightClass.LIGHT, "freq": 4.2, "season": SeasonalPattern.BACK_TO_SCHOOL, "cost": 79.99},
-                ]
-            },
-            
-            # Home & Garden - Seasonal patterns, various sizes
-            {
-                "category": "home_garden",
-                "items": [
-                    {"name": "Space Heater", "size": ItemSize.MEDIUM, "weight": WeightClass.MEDIUM, "freq": 3.8, "season": SeasonalPattern.WINTER_HEAVY, "cost": 149.99},
-                    {"name": "Air Conditioner", "size": ItemSize.LARGE, "weight": WeightClass.HEAVY, "freq": 2.1, "season": SeasonalPattern.SUMMER_HEAVY, "cost": 299.99},
-                    {"name": "Garden Hose", "size": ItemSize.MEDIUM, "weight": WeightClass.MEDIUM, "freq": 5.3, "season": SeasonalPattern.SPRING_HEAVY, "cost": 34.99},
-                    {"name": "Lawn Mower", "size": ItemSize.LARGE, "weight": WeightClass.HEAVY, "freq": 1.8, "season": SeasonalPattern.SPRING_HEAVY, "cost": 449.99},
-                    {"name": "Christmas Lights", "size": ItemSize.SMALL, "weight": WeightClass.LIGHT, "freq": 0.5, "season": SeasonalPattern.HOLIDAY_PEAK, "cost": 24.99},
-                    {"name": "Patio Furniture Set", "size": ItemSize.LARGE, "weight": WeightClass.HEAVY, "freq": 1.2, "season": SeasonalPattern.SPRING_HEAVY, "cost": 599.99},
-                    {"name": "Snow Shovel", "size": ItemSize.MEDIUM, "weight": WeightClass.MEDIUM, "freq": 2.7, "season": SeasonalPattern.WINTER_HEAVY, "cost": 29.99},
-                    {"name": "Barbecue Grill", "size": ItemSize.LARGE, "weight": WeightClass.HEAVY, "freq": 1.9, "season": SeasonalPattern.SUMMER_HEAVY, "cost": 399.99},
-                ]
-            },
-            
-            # Clothing & Fashion - Seasonal, light weight, small/medium
-            {
-                "category": "clothing",
-                "items": [
-                    {"name": "Winter Coat", "size": ItemSize.MEDIUM, "weight": WeightClass.LIGHT, "freq": 4.6, "season": SeasonalPattern.WINTER_HEAVY, "cost": 129.99},
-                    {"name": "Summer Dress", "size": ItemSize.SMALL, "weight": WeightClass.LIGHT, "freq": 7.2, "season": SeasonalPattern.SUMMER_HEAVY, "cost": 59.99},
-                    {"name": "Running Shoes", "size": ItemSize.SMALL, "weight": WeightClass.LIGHT, "freq": 13.4, "season": SeasonalPattern.ALL_YEAR, "cost": 119.99},
-                    {"name": "Jeans", "size": ItemSize.SMALL, "weight": WeightClass.LIGHT, "freq": 16.8, "season": SeasonalPattern.ALL_YEAR, "cost": 79.99},
-                    {"name": "Sweater", "size": ItemSize.SMALL, "weight": WeightClass.LIGHT, "freq": 6.9, "season": SeasonalPattern.AUTUMN_HEAVY, "cost": 49.99},
-                    {"name": "Swimwear", "size": ItemSize.SMALL, "weight": WeightClass.LIGHT, "freq": 3.1, "season": SeasonalPattern.SUMMER_HEAVY, "cost": 39.99},
-                    {"name": "School Backpack", "size": ItemSize.MEDIUM, "weight": WeightClass.LIGHT, "freq": 5.7, "season": SeasonalPattern.BACK_TO_SCHOOL, "cost": 49.99},
-                ]
-            },
-            
-            # Sports & Outdoors - Seasonal, various sizes and weights
-            {
-                "category": "sports",
-                "items": [
-                    {"name": "Ski Equipment Set", "size": ItemSize.LARGE, "weight": WeightClass.HEAVY, "freq": 1.4, "season": SeasonalPattern.WINTER_HEAVY, "cost": 799.99},
-                    {"name": "Bicycle", "size": ItemSize.LARGE, "weight": WeightClass.HEAVY, "freq": 3.6, "season": SeasonalPattern.SPRING_HEAVY, "cost": 599.99},
-                    {"name": "Tennis Racket", "size": ItemSize.MEDIUM, "weight": WeightClass.LIGHT, "freq": 4.8, "season": SeasonalPattern.SUMMER_HEAVY, "cost": 149.99},
-                    {"name": "Camping Tent", "size": ItemSize.MEDIUM, "weight": WeightClass.MEDIUM, "freq": 2.9, "season": SeasonalPattern.SUMMER_HEAVY, "cost": 199.99},
-                    {"name": "Yoga Mat", "size": ItemSize.MEDIUM, "weight": WeightClass.LIGHT, "freq": 8.1, "season": SeasonalPattern.ALL_YEAR, "cost": 29.99},
-                    {"name": "Football", "size": ItemSize.SMALL, "weight": WeightClass.LIGHT, "freq": 6.3, "season": SeasonalPattern.AUTUMN_HEAVY, "cost": 24.99},
-                    {"name": "Golf Club Set", "size": ItemSize.LARGE, "weight": WeightClass.HEAVY, "freq": 2.2, "season": SeasonalPattern.SPRING_HEAVY, "cost": 899.99},
-                ]
-            },
-            
-            # Books & Education - Back to school heavy, light weight
-            {
-                "category": "books",
-                "items": [
-                    {"name": "Textbook Mathematics", "size": ItemSize.SMALL, "weight": WeightClass.LIGHT, "freq": 7.5, "season": SeasonalPattern.BACK_TO_SCHOOL, "cost": 199.99},
-                    {"name": "Novel Fiction", "size": ItemSize.SMALL, "weight": WeightClass.LIGHT, "freq": 12.3, "season": SeasonalPattern.ALL_YEAR, "cost": 14.99},
-                    {"name": "Children's Book Set", "size": ItemSize.SMALL, "weight": WeightClass.LIGHT, "freq": 8.7, "season": SeasonalPattern.HOLIDAY_PEAK, "cost": 39.99},
-                    {"name": "Professional Manual", "size": ItemSize.MEDIUM, "weight": WeightClass.LIGHT, "freq": 3.4, "season": SeasonalPattern.ALL_YEAR, "cost": 89.99},
-                    {"name": "Art Supplies Kit", "size": ItemSize.MEDIUM, "weight": WeightClass.LIGHT, "freq": 5.6, "season": SeasonalPattern.BACK_TO_SCHOOL, "cost": 79.99},
-                    {"name": "Calculator Scientific", "size": ItemSize.SMALL, "weight": WeightClass.LIGHT, "freq": 4.1, "season": SeasonalPattern.BACK_TO_SCHOOL, "cost": 129.99},
-                ]
-            },
-            
-            # Tools & Hardware - Medium frequency, heavy items
-            {
-                "category": "tools",
-                "items": [
-                    {"name": "Power Drill", "size": ItemSize.MEDIUM, "weight": WeightClass.MEDIUM, "freq": 6.8, "season": SeasonalPattern.SPRING_HEAVY, "cost": 199.99},
-                    {"name": "Tool Box Set", "size": ItemSize.LARGE, "weight": WeightClass.HEAVY, "freq": 4.2, "season": SeasonalPattern.ALL_YEAR, "cost": 299.99},
-                    {"name": "Hammer", "size": ItemSize.SMALL, "weight": WeightClass.MEDIUM, "freq": 9.1, "season": SeasonalPattern.ALL_YEAR, "cost": 24.99},
-                    {"name": "Screwdriver Set", "size": ItemSize.SMALL, "weight": WeightClass.LIGHT, "freq": 11.6, "season": SeasonalPattern.ALL_YEAR, "cost": 39.99},
-                    {"name": "Chainsaw", "size": ItemSize.LARGE, "weight": WeightClass.HEAVY, "freq": 1.7, "season": SeasonalPattern.AUTUMN_HEAVY, "cost": 399.99},
-                    {"name": "Work Gloves", "size": ItemSize.SMALL, "weight": WeightClass.LIGHT, "freq": 14.2, "season": SeasonalPattern.ALL_YEAR, "cost": 12.99},
-                ]
-            },
-            
-            # Kitchen & Appliances - Holiday peaks, various sizes
-            {
-                "category": "kitchen",
-                "items": [
-                    {"name": "Coffee Machine", "size": ItemSize.MEDIUM, "weight": WeightClass.MEDIUM, "freq": 7.9, "season": SeasonalPattern.ALL_YEAR, "cost": 149.99},
-                    {"name": "Microwave Oven", "size": ItemSize.LARGE, "weight": WeightClass.HEAVY, "freq": 3.8, "season": SeasonalPattern.ALL_YEAR, "cost": 199.99},
-                    {"name": "Blender", "size": ItemSize.MEDIUM, "weight": WeightClass.MEDIUM, "freq": 5.4, "season": SeasonalPattern.ALL_YEAR, "cost": 89.99},
-                    {"name": "Cookie Cutters Set", "size": ItemSize.SMALL, "weight": WeightClass.LIGHT, "freq": 2.1, "season": SeasonalPattern.HOLIDAY_PEAK, "cost": 19.99},
-                    {"name": "Stand Mixer", "size": ItemSize.LARGE, "weight": WeightClass.HEAVY, "freq": 2.7, "season": SeasonalPattern.HOLIDAY_PEAK, "cost": 399.99},
-                ]
-            }
-        ]
+        self.item_templates = _ITEM_TEMPLATES
+        
+        # Empty columns so queries on a fresh generator return empty results
+        self._index_items()
     
     def generate_items(self, total_items: int = 50) -> List[WarehouseItem]:
         """Generate specified number of warehouse items"""
         self.items = []
         item_counter = 1
         
+        # Draw all per-item jitter up front (categories split total_items exactly)
+        picks_jitter = self._rng.uniform(-1.0, 1.0, total_items).tolist()
+        cost_jitter = self._rng.uniform(0.9, 1.1, total_items).tolist()
+        
         # Calculate items per category
         items_per_category = total_items // len(self.item_templates)
         remaining_items = total_items % len(self.item_templates)
         
-        for category_template in self.item_templates:
-            category = category_template["category"]
-            category_items = category_template["items"]
+        for category, category_items in self.item_templates:
+            
+            # Classify every template of the category at once: <5 low, 5-10 medium, >=10 high
+            popularity_idx = np.digitize([t.freq for t in category_items], _POPULARITY_BINS)
+            template_popularity = [_POPULARITY_RANKS[p] for p in popularity_idx]
+            
+            # Storage requirements depend only on the template and category
+            template_storage_reqs = []
+            for t in category_items:
+                reqs = []
+                if t.weight == WeightClass.HEAVY:
+                    reqs.append("ground_level_only")
+                if category == "electronics":
+                    reqs.append("climate_controlled")
+                if t.winter_name or t.season == SeasonalPattern.WINTER_HEAVY:
+                    reqs.append("seasonal_storage")
+                template_storage_reqs.append(reqs)
             
             # Determine how many items for this category
             category_count = items_per_category
@@ -190,42 +276,27 @@ class WarehouseDataGenerator:
             # Generate items for this category
             for i in range(category_count):
                 # Select base item (cycle through available items)
-                base_item = category_items[i % len(category_items)]
+                template_idx = i % len(category_items)
+                base_item = category_items[template_idx]
                 
                 # Add some variation to make items unique
                 variation_suffix = "" if i < len(category_items) else f" v{i // len(category_items) + 1}"
                 
-                # Determine popularity based on frequency
-                freq = base_item["freq"]
-                if freq >= 10:
-                    popularity = "high"
-                elif freq >= 5:
-                    popularity = "medium"
-                else:
-                    popularity = "low"
-                
-                # Create storage requirements
-                storage_reqs = []
-                if base_item["weight"] == WeightClass.HEAVY:
-                    storage_reqs.append("ground_level_only")
-                if category == "electronics":
-                    storage_reqs.append("climate_controlled")
-                if "winter" in base_item["name"].lower() or base_item["season"] == SeasonalPattern.WINTER_HEAVY:
-                    storage_reqs.append("seasonal_storage")
+                freq = base_item.freq
                 
                 # Generate item
                 item = WarehouseItem(
                     id=f"WH_{item_counter:03d}",
-                    name=base_item["name"] + variation_suffix,
+                    name=base_item.name + variation_suffix,
                     category=category,
-                    size=base_item["size"],
-                    weight_class=base_item["weight"],
-                    base_daily_picks=freq + random.uniform(-1.0, 1.0),  # Add some randomness
-                    seasonal_pattern=base_item["season"],
-                    seasonal_multiplier=self._calculate_seasonal_multiplier(base_item["season"]),
-                    unit_cost=base_item["cost"] * random.uniform(0.9, 1.1),  # Price variation
-                    storage_requirements=storage_reqs,
-                    popularity_rank=popularity
+                    size=base_item.size,
+                    weight_class=base_item.weight,
+                    base_daily_picks=freq + picks_jitter[item_counter - 1],  # Add some randomness
+                    seasonal_pattern=base_item.season,
+                    seasonal_multiplier=_SEASONAL_MULTIPLIERS[base_item.season.index],
+                    unit_cost=base_item.cost * cost_jitter[item_counter - 1],  # Price variation
+                    storage_requirements=list(template_storage_reqs[template_idx]),
+                    popularity_rank=template_popularity[template_idx]
                 )
                 
                 self.items.append(item)
@@ -233,36 +304,21 @@ class WarehouseDataGenerator:
         
         # Sort by popularity (high frequency items first)
         self.items.sort(key=lambda x: x.base_daily_picks, reverse=True)
+        self._index_items()
         
         print(f"Generated {len(self.items)} warehouse items across {len(self.item_templates)} categories")
         return self.items
     
-    def _calculate_seasonal_multiplier(self, pattern: SeasonalPattern) -> float:
-        """Calculate the peak seasonal multiplier for a pattern"""
-        multipliers = {
-            SeasonalPattern.ALL_YEAR: 1.0,
-            SeasonalPattern.WINTER_HEAVY: 1.9,
-            SeasonalPattern.SPRING_HEAVY: 1.9,
-            SeasonalPattern.SUMMER_HEAVY: 1.9,
-            SeasonalPattern.AUTUMN_HEAVY: 1.9,
-            SeasonalPattern.HOLIDAY_PEAK: 2.2,
-            SeasonalPattern.BACK_TO_SCHOOL: 2.0
-        }
-        return multipliers[pattern]
-    
     def save_items_to_json(self, filename: str = "warehouse_items.json") -> None:
         """Save generated items to JSON file"""
-        items_data = []
-        for item in self.items:
-            item_dict = asdict(item)
-            # Convert enums to strings for JSON serialization
-            item_dict["size"] = item.size.value
-            item_dict["weight_class"] = item.weight_class.value
-            item_dict["seasonal_pattern"] = item.seasonal_pattern.value
-            items_data.append(item_dict)
+        items_data = list(map(_json_record, self.items))
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(items_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(items_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(items_data, f, indent=2, ensure_ascii=False)
         
         print(f"Saved {len(self.items)} items to {filename}")
     
@@ -279,20 +335,7 @@ class WarehouseDataGenerator:
             ])
             
             # Data rows
-            for item in self.items:
-                writer.writerow([
-                    item.id,
-                    item.name,
-                    item.category,
-                    item.size.value,
-                    item.weight_class.value,
-                    f"{item.base_daily_picks:.2f}",
-                    item.seasonal_pattern.value,
-                    f"{item.seasonal_multiplier:.2f}",
-                    f"${item.unit_cost:.2f}",
-                    item.popularity_rank,
-                    '; '.join(item.storage_requirements)
-                ])
+            writer.writerows(map(_csv_row, self.items))
         
         print(f"Saved {len(self.items)} items to {filename}")
     
@@ -311,22 +354,53 @@ class WarehouseDataGenerator:
             item = WarehouseItem(**item_dict)
             self.items.append(item)
         
+        # Keep the same high-frequency-first order generate_items guarantees
+        self.items.sort(key=lambda x: x.base_daily_picks, reverse=True)
+        self._index_items()
         print(f"Loaded {len(self.items)} items from {filename}")
         return self.items
     
+    def _index_items(self) -> None:
+        """Build column arrays parallel to self.items for vectorized filters and stats"""
+        n = len(self.items)
+        
+        def column(values, dtype):
+            return np.fromiter(values, dtype=dtype, count=n)
+        
+        self._cols = {
+            'picks': column((item.base_daily_picks for item in self.items), np.float64),
+            'size_idx': column((item.size.index for item in self.items), np.int8),
+            'weight_idx': column((item.weight_class.index for item in self.items), np.int8),
+            'season_idx': column((item.seasonal_pattern.index for item in self.items), np.int8),
+            'unit_cost': column((item.unit_cost for item in self.items), np.float64),
+            'category': [item.category for item in self.items],
+        }
+        
+        # True for items whose demand varies by season
+        self._seasonal_mask = self._cols['season_idx'] != SeasonalPattern.ALL_YEAR.index
+        
+        # Items per category, in self.items order
+        self._by_category = {}
+        for item in self.items:
+            self._by_category.setdefault(item.category, []).append(item)
+    
+    def compute_monthly_demand_matrix(self) -> np.ndarray:
+        """Daily picks for every item and month, shape (num_items, 12) with columns Jan..Dec"""
+        return daily_picks_batch(self._cols['picks'], self._cols['season_idx'], np.arange(1, 13))
+    
     def get_items_by_category(self, category: str) -> List[WarehouseItem]:
         """Get all items in a specific category"""
-        return [item for item in self.items if item.category == category]
+        return list(self._by_category.get(category, ()))
     
     def get_high_frequency_items(self, threshold: float = 10.0) -> List[WarehouseItem]:
         """Get items with high pick frequency"""
-        return [item for item in self.items if item.base_daily_picks >= threshold]
+        return [self.items[i] for i in np.flatnonzero(self._cols['picks'] >= threshold)]
     
     def get_seasonal_items(self, exclude_all_year: bool = True) -> List[WarehouseItem]:
         """Get items with seasonal patterns"""
         if exclude_all_year:
-            return [item for item in self.items if item.seasonal_pattern != SeasonalPattern.ALL_YEAR]
-        return [item for item in self.items if item.seasonal_pattern != SeasonalPattern.ALL_YEAR]
+            return [self.items[i] for i in np.flatnonzero(self._seasonal_mask)]
+        return list(self.items)
     
     def print_items_summary(self) -> None:
         """Print summary statistics of generated items"""
@@ -339,48 +413,43 @@ class WarehouseDataGenerator:
         print(f"{'='*60}")
         
         # Category breakdown
-        categories = {}
-        for item in self.items:
-            categories[item.category] = categories.get(item.category, 0) + 1
+        categories = Counter(self._cols['category'])
         
         print(f"\nItems by Category:")
         for category, count in sorted(categories.items()):
             print(f"  {category:15s}: {count:2d} items")
         
         # Size breakdown
-        sizes = {}
-        for item in self.items:
-            sizes[item.size.value] = sizes.get(item.size.value, 0) + 1
+        size_counts = np.bincount(self._cols['size_idx'], minlength=len(ItemSize))
+        sizes = {size.value: int(size_counts[size.index]) for size in ItemSize if size_counts[size.index]}
         
         print(f"\nItems by Size:")
         for size, count in sorted(sizes.items()):
             print(f"  {size:8s}: {count:2d} items")
         
         # Weight breakdown
-        weights = {}
-        for item in self.items:
-            weights[item.weight_class.value] = weights.get(item.weight_class.value, 0) + 1
+        weight_counts = np.bincount(self._cols['weight_idx'], minlength=len(WeightClass))
+        weights = {weight.value: int(weight_counts[weight.index]) for weight in WeightClass if weight_counts[weight.index]}
         
         print(f"\nItems by Weight Class:")
         for weight, count in sorted(weights.items()):
             print(f"  {weight:8s}: {count:2d} items")
         
         # Frequency statistics
-        frequencies = [item.base_daily_picks for item in self.items]
+        frequencies = self._cols['picks']
         print(f"\nDaily Pick Frequency:")
-        print(f"  Average: {sum(frequencies)/len(frequencies):.2f} picks/day")
-        print(f"  Range:   {min(frequencies):.2f} - {max(frequencies):.2f} picks/day")
+        print(f"  Average: {frequencies.mean():.2f} picks/day")
+        print(f"  Range:   {frequencies.min():.2f} - {frequencies.max():.2f} picks/day")
         
         # Top 10 most frequent items
         print(f"\nTop 10 Most Frequently Picked Items:")
-        sorted_items = sorted(self.items, key=lambda x: x.base_daily_picks, reverse=True)
-        for i, item in enumerate(sorted_items[:10]):
+        # self.items is kept sorted by picks (descending) by generate_items/load_items_from_json
+        for i, item in enumerate(self.items[:10]):
             print(f"  {i+1:2d}. {item.name:25s} ({item.base_daily_picks:5.1f} picks/day)")
         
         # Seasonal breakdown
-        seasons = {}
-        for item in self.items:
-            seasons[item.seasonal_pattern.value] = seasons.get(item.seasonal_pattern.value, 0) + 1
+        season_counts = np.bincount(self._cols['season_idx'], minlength=len(SeasonalPattern))
+        seasons = {pattern.value: int(season_counts[pattern.index]) for pattern in SeasonalPattern if season_counts[pattern.index]}
         
         print(f"\nItems by Seasonal Pattern:")
         for season, count in sorted(seasons.items()):
@@ -412,11 +481,9 @@ def main():
     print(f"{'Item':<25s} {'Jan':<6s} {'Jun':<6s} {'Sep':<6s} {'Dec':<6s}")
     print("-" * 50)
     
-    for item in items[:5]:  # Show first 5 items
-        jan_picks = item.get_daily_picks_for_month(1)
-        jun_picks = item.get_daily_picks_for_month(6)
-        sep_picks = item.get_daily_picks_for_month(9)
-        dec_picks = item.get_daily_picks_for_month(12)
+    demand = generator.compute_monthly_demand_matrix()
+    for item, monthly_picks in zip(items[:5], demand):  # Show first 5 items
+        jan_picks, jun_picks, sep_picks, dec_picks = monthly_picks[[0, 5, 8, 11]]
         
         print(f"{item.name[:24]:<25s} {jan_picks:5.1f} {jun_picks:5.1f} {sep_picks:5.1f} {dec_picks:5.1f}")
     
@@ -1,6 +1,6 @@
 import numpy as np
-from dataclasses import dataclass
-from typing import List, Tuple, Optional, Dict
+from dataclasses import dataclass, field
+from typing import List, Tuple, Optional, Dict, ClassVar
 
 # Import shared enums
 try:
@@ -13,7 +13,58 @@ except ImportError:
     sys.path.insert(0, parent_dir)
     from shared_enums import CellType, ItemSize, WeightClass
 
-@dataclass
+# Length of a bincount over layout_grid that covers every CellType value
+_CELLTYPE_MAX = max(ct.value for ct in CellType) + 1
+
+# CellType for each possible grid value (None for values that aren't a cell type)
+_INT2CT = [None] * 256
+for _ct in CellType:
+    _INT2CT[_ct.value] = _ct
+
+# Storage space taken by each item size, in "small item units" (a cell holds 4)
+_ITEM_SIZE_SPACE = {ItemSize.SMALL: 1, ItemSize.MEDIUM: 2, ItemSize.LARGE: 4}
+_SIZE_SPACE = {'small': 1, 'medium': 2, 'large': 4}
+
+# Cell types workers can walk on
+_WALKABLE_VALUES = np.array([
+    CellType.AISLE.value,
+    CellType.MAIN_HALLWAY.value,
+    CellType.CROSS_AISLE.value,
+    CellType.ENTRANCE.value,
+    CellType.EXIT.value
+])
+
+# Neighbor offsets checked by get_accessible_neighbors
+_NEIGHBOR_OFFSETS = ((0, 1), (0, -1), (1, 0), (-1, 0))  # N, S, E, W
+
+# print_layout symbol per cell-type value ('?' for unknown values)
+_LAYOUT_SYMBOLS = np.full(256, '?', dtype='U1')
+for _cell_type, _symbol in (
+    (CellType.WALL, '█'),
+    (CellType.SHELF, '▢'),
+    (CellType.AISLE, '·'),
+    (CellType.MAIN_HALLWAY, '═'),
+    (CellType.CROSS_AISLE, '┼'),
+    (CellType.ENTRANCE, 'E'),
+    (CellType.EXIT, 'X')
+):
+    _LAYOUT_SYMBOLS[_cell_type.value] = _symbol
+
+# Highest storage level each weight class may go on (light items: any level)
+_ANY_LEVEL = 10**9
+_MAX_LEVEL_FOR_WEIGHT = {WeightClass.HEAVY: 1, WeightClass.MEDIUM: 2, WeightClass.LIGHT: _ANY_LEVEL}
+
+
+def _item_space(item) -> int:
+    """Space units an item takes up; uses Item.space, else derives it from the size"""
+    space = getattr(item, 'space', None)
+    if space is not None:
+        return space
+    # Other item types (e.g. WarehouseItem) - handle both enum and string sizes
+    size = item.size
+    return _SIZE_SPACE.get(size.value if hasattr(size, 'value') else str(size), 1)
+
+@dataclass(slots=True)
 class Item:
     """Warehouse item definition"""
     id: str
@@ -22,86 +73,74 @@ class Item:
     daily_picks: float
     category: str
     orientation: Tuple[int, int] = (1, 1)  # (width, depth) in cells
+    space: int = field(init=False)  # Storage units taken, cached from size
+    
+    def __post_init__(self):
+        self.space = _ITEM_SIZE_SPACE.get(self.size)
+        if self.space is None:
+            self.space = _SIZE_SPACE.get(str(self.size), 1)
 
-@dataclass
+@dataclass(slots=True)
 class StorageCell:
     """Individual storage cell that can hold multiple items"""
-    max_capacity: Dict[ItemSize, int]
-    current_items: List[Item]
+    # Same capacity for every cell, so shared at class level instead of stored per cell
+    MAX_CAPACITY: ClassVar[Dict[ItemSize, int]] = {
+        ItemSize.SMALL: 4,
+        ItemSize.MEDIUM: 2,
+        ItemSize.LARGE: 1
+    }
+    
+    current_items: Dict[str, Item]  # item id -> item (a list of items is accepted and converted)
     level: int
     x: int
     y: int
+    _space_used: int = field(default=0, init=False, repr=False)  # Kept in step by add/remove
+    # Warehouse whose occupancy arrays and item index mirror this cell (None when standalone)
+    _owner: Optional["LargeWarehouse"] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        if not hasattr(self, 'max_capacity') or not self.max_capacity:
-            self.max_capacity = {
-                ItemSize.SMALL: 4,
-                ItemSize.MEDIUM: 2, 
-                ItemSize.LARGE: 1
-            }
         if not hasattr(self, 'current_items'):
-            self.current_items = []
+            self.current_items = {}
+        elif not isinstance(self.current_items, dict):
+            self.current_items = {item.id: item for item in self.current_items}
+        self._space_used = sum(_item_space(item) for item in self.current_items.values())
+    
+    @property
+    def max_capacity(self) -> Dict[ItemSize, int]:
+        """Maximum items of each size a cell holds"""
+        return self.MAX_CAPACITY
     
     def can_store_item(self, item: Item) -> bool:
         """Check if this cell can store the given item"""
         # Check weight restrictions
-        if item.weight_class == WeightClass.HEAVY and self.level > 1:
-            return False
-        if item.weight_class == WeightClass.MEDIUM and self.level > 2:
+        if self.level > _MAX_LEVEL_FOR_WEIGHT.get(item.weight_class, _ANY_LEVEL):
             return False
         
-        # Count current items by size
-        current_count = {size: 0 for size in ItemSize}
-        for current_item in self.current_items:
-            current_count[current_item.size] += 1
-        
-        # Calculate space used (in "small item units")
-        space_used = (current_count[ItemSize.LARGE] * 4 + 
-                     current_count[ItemSize.MEDIUM] * 2 + 
-                     current_count[ItemSize.SMALL])
-        
-        # Calculate space needed for new item - handle both enum and string
-        if hasattr(item.size, 'value'):
-            size_str = item.size.value
-        else:
-            size_str = str(item.size)
-        
-        space_needed_map = {'small': 1, 'medium': 2, 'large': 4}
-        space_needed = space_needed_map.get(size_str, 1)
-        
-        return space_used + space_needed <= 4
+        # Space used is tracked in "small item units"
+        return self._space_used + _item_space(item) <= 4
     
     def add_item(self, item: Item) -> bool:
         """Add item to this cell if possible"""
-        if self.can_store_item(item):
-            self.current_items.append(item)
-            return True
-        return False
+        if item.id in self.current_items or not self.can_store_item(item):
+            return False
+        if self._owner is not None and not self._owner._register_item(self, item):
+            return False
+        self.current_items[item.id] = item
+        self._space_used += _item_space(item)
+        return True
     
     def remove_item(self, item_id: str) -> Optional[Item]:
         """Remove item by ID and return it"""
-        for i, item in enumerate(self.current_items):
-            if item.id == item_id:
-                return self.current_items.pop(i)
-        return None
+        item = self.current_items.pop(item_id, None)
+        if item is not None:
+            self._space_used -= _item_space(item)
+            if self._owner is not None:
+                self._owner._unregister_item(self, item)
+        return item
     
     def get_occupancy_rate(self) -> float:
         """Get current occupancy as percentage (0.0 to 1.0)"""
-        if not self.current_items:
-            return 0.0
-        
-        # Count space used by checking each item's size
-        space_used = 0
-        for item in self.current_items:
-            if hasattr(item.size, 'value'):
-                size_str = item.size.value
-            else:
-                size_str = str(item.size)
-            
-            size_points = {'small': 1, 'medium': 2, 'large': 4}
-            space_used += size_points.get(size_str, 1)
-        
-        return space_used / 4.0
+        return self._space_used / 4.0
 
 class LargeWarehouse:
     """Large-scale warehouse with multiple levels and realistic layout"""
@@ -119,14 +158,29 @@ class LargeWarehouse:
         self.depth = depth
         self.levels = levels
         
-        # Grid: 0=cell_type, storage handled separately
-        self.layout_grid = np.zeros((width, depth), dtype=int)
+        # Grid: 0=cell_type, storage handled separately (CellType values fit in a byte).
+        # Indexed [y, x] so each warehouse row is contiguous in memory
+        self.layout_grid = np.zeros((depth, width), dtype=np.uint8)
         
         # Storage cells for each shelf location and level
         self.storage_cells: Dict[Tuple[int, int, int], StorageCell] = {}
         
+        # Columnar mirror of the storage cells: shelf coordinates (S, 2), a (x, y) -> row
+        # lookup, and space units used per shelf row and level (column level - 1)
+        self.shelf_xy = np.empty((0, 2), dtype=int)
+        self._shelf_index: Dict[Tuple[int, int], int] = {}
+        self.space_used = np.zeros((0, levels), dtype=np.uint8)
+        self.shelf_positions: List[Tuple[int, int]] = []
+        
         # Worker positions (can only have 1 worker per cell)
         self.worker_positions: Dict[Tuple[int, int], str] = {}
+        self._worker_pos: Dict[str, Tuple[int, int]] = {}  # Reverse map: worker id -> position
+        
+        # Running count of items stored through place_item/remove_item
+        self._item_count = 0
+        
+        # Reverse index: item id -> (x, y, level) of the cell holding it
+        self._item_location: Dict[str, Tuple[int, int, int]] = {}
         
         # Important locations
         self.entrances = []
@@ -137,6 +191,20 @@ class LargeWarehouse:
         self._create_warehouse_layout()
         self._initialize_storage_cells()
         
+        # Walkable-cell mask over the finished layout, indexed [y, x], plus a copy with a
+        # one-cell non-walkable border so neighbor lookups need no bounds checks
+        self._walkable = np.isin(self.layout_grid, _WALKABLE_VALUES)
+        self._walkable_padded = np.pad(self._walkable, 1)
+        self._build_neighbor_table()
+        
+        # The layout is fixed from here on, so memoize each cell's CellType ([y][x] lists)
+        self._cell_types = [[_INT2CT[v] or CellType.WALL for v in row] for row in self.layout_grid.tolist()]
+        
+        # Cached (x, y) positions by kind, x-major like a nested x/y scan of the grid
+        self._positions_by_type = self._group_positions_by_type()
+        self.walkable_positions = self._mask_positions(self._walkable)
+        self.aisle_positions = self.find_positions(CellType.AISLE)
+        
         print(f"Created large warehouse: {width}x{depth} with {levels} levels")
         print(f"Total storage cells: {len(self.storage_cells)}")
         print(f"Entrances: {len(self.entrances)}, Exit: {self.exit}")
@@ -148,10 +216,9 @@ class LargeWarehouse:
         
         # Create main hallway (horizontal through middle)
         main_hallway_y = self.depth // 2
-        for x in range(2, self.width - 2):
-            for y in range(main_hallway_y - 1, main_hallway_y + 2):  # 3 cells wide
-                self.layout_grid[x, y] = CellType.MAIN_HALLWAY.value
-                self.main_hallway_cells.append((x, y))
+        hallway_rows = range(main_hallway_y - 1, main_hallway_y + 2)  # 3 cells wide
+        self.layout_grid[hallway_rows.start:hallway_rows.stop, 2:max(2, self.width - 2)] = CellType.MAIN_HALLWAY.value
+        self.main_hallway_cells.extend((x, y) for x in range(2, self.width - 2) for y in hallway_rows)
         
         # Create storage zones with aisles
         self._create_storage_zones()
@@ -180,96 +247,123 @@ class LargeWarehouse:
     
     def _create_zone(self, start_x, end_x, start_y, end_y, zone_id):
         """Create a storage zone with alternating shelves and aisles"""
-        current_x = start_x
-        
-        while current_x < end_x:
-            # Determine if this should be shelf or aisle
-            if (current_x - start_x) % 4 == 0 or (current_x - start_x) % 4 == 1:
-                # Create shelf rows (2 cells wide)
-                for x in range(current_x, min(current_x + 2, end_x)):
-                    for y in range(start_y, end_y):
-                        if x < self.width and y < self.depth:
-                            self.layout_grid[x, y] = CellType.SHELF.value
-                current_x += 2
-            else:
-                # Create aisle (2 cells wide for bidirectional traffic)
-                for x in range(current_x, min(current_x + 2, end_x)):
-                    for y in range(start_y, end_y):
-                        if x < self.width and y < self.depth:
-                            self.layout_grid[x, y] = CellType.AISLE.value
-                current_x += 2
+        cols = np.arange(start_x, min(end_x, self.width))
+        rows = slice(start_y, min(end_y, self.depth))
+        
+        # Columns alternate in 2-wide bands: shelf rows, then aisles (2 wide for bidirectional traffic)
+        is_shelf = ((cols - start_x) // 2) % 2 == 0
+        self.layout_grid[rows, cols[is_shelf]] = CellType.SHELF.value
+        self.layout_grid[rows, cols[~is_shelf]] = CellType.AISLE.value
     
     def _create_entry_exit_points(self):
         """Create entrance and exit points"""
         # Entrance 1: Left side of main hallway
         entrance1 = (0, self.depth // 2)
-        self.layout_grid[0, self.depth // 2] = CellType.ENTRANCE.value
-        self.layout_grid[1, self.depth // 2] = CellType.ENTRANCE.value
+        self.layout_grid[self.depth // 2, 0] = CellType.ENTRANCE.value
+        self.layout_grid[self.depth // 2, 1] = CellType.ENTRANCE.value
         self.entrances.append(entrance1)
         
         # Entrance 2: Right side of main hallway  
         entrance2 = (0, self.depth // 2 + 1)
-        self.layout_grid[0, self.depth // 2 + 1] = CellType.ENTRANCE.value
-        self.layout_grid[1, self.depth // 2 + 1] = CellType.ENTRANCE.value
+        self.layout_grid[self.depth // 2 + 1, 0] = CellType.ENTRANCE.value
+        self.layout_grid[self.depth // 2 + 1, 1] = CellType.ENTRANCE.value
         self.entrances.append(entrance2)
         
         # Exit: Opposite side
         exit_point = (self.width - 1, self.depth // 2)
-        self.layout_grid[self.width - 1, self.depth // 2] = CellType.EXIT.value
-        self.layout_grid[self.width - 2, self.depth // 2] = CellType.EXIT.value
+        self.layout_grid[self.depth // 2, self.width - 1] = CellType.EXIT.value
+        self.layout_grid[self.depth // 2, self.width - 2] = CellType.EXIT.value
         self.exit = exit_point
     
     def _create_cross_aisles(self):
         """Create cross-aisles for zone connectivity"""
         # Vertical cross-aisles every 8 cells
+        zone_rows = (
+            slice(3, max(3, self.depth // 2 - 2)),                        # Upper zone cross-aisle
+            slice(self.depth // 2 + 3, max(self.depth // 2 + 3, self.depth - 3))  # Lower zone cross-aisle
+        )
         for x in range(8, self.width - 2, 8):
-            # Upper zone cross-aisle
-            for y in range(3, self.depth // 2 - 2):
-                if self.layout_grid[x, y] == CellType.SHELF.value:
-                    self.layout_grid[x, y] = CellType.CROSS_AISLE.value
-            
-            # Lower zone cross-aisle
-            for y in range(self.depth // 2 + 3, self.depth - 3):
-                if self.layout_grid[x, y] == CellType.SHELF.value:
-                    self.layout_grid[x, y] = CellType.CROSS_AISLE.value
+            for rows in zone_rows:
+                column = self.layout_grid[rows, x]  # view into the grid
+                column[column == CellType.SHELF.value] = CellType.CROSS_AISLE.value
     
     def _initialize_storage_cells(self):
         """Initialize storage cells for all shelf locations"""
-        for x in range(self.width):
-            for y in range(self.depth):
-                if self.layout_grid[x, y] == CellType.SHELF.value:
-                    # Create storage cell for each level
-                    for level in range(1, self.levels + 1):
-                        cell = StorageCell(
-                            max_capacity={
-                                ItemSize.SMALL: 4,
-                                ItemSize.MEDIUM: 2,
-                                ItemSize.LARGE: 1
-                            },
-                            current_items=[],
-                            level=level,
-                            x=x,
-                            y=y
-                        )
-                        self.storage_cells[(x, y, level)] = cell
+        # Transposed view so shelves come out as (x, y) pairs in x-major order
+        self.shelf_xy = np.argwhere(self.layout_grid.T == CellType.SHELF.value)
+        self.space_used = np.zeros((len(self.shelf_xy), self.levels), dtype=np.uint8)
+        
+        shelves = [tuple(xy) for xy in self.shelf_xy.tolist()]
+        self.shelf_positions = shelves
+        self._shelf_index = {xy: row for row, xy in enumerate(shelves)}
+        
+        # One storage cell per shelf and level, built in a single pass
+        levels = range(1, self.levels + 1)
+        self.storage_cells = {
+            (x, y, level): StorageCell(current_items={}, level=level, x=x, y=y)
+            for x, y in shelves for level in levels
+        }
+        
+        # Cells report every add/remove back so the arrays above never go stale
+        for cell in self.storage_cells.values():
+            cell._owner = self
+    
+    def _build_neighbor_table(self):
+        """Precompute walkable neighbors of every cell as flat indices (y * width + x)"""
+        w, d = self.width, self.depth
+        padded = self._walkable_padded
+        flat = np.arange(w * d, dtype=np.int32).reshape(d, w)
+        
+        # One column per direction in _NEIGHBOR_OFFSETS order; -1 where not walkable
+        valid = np.stack([padded[1 + dy:1 + dy + d, 1 + dx:1 + dx + w]
+                          for dx, dy in _NEIGHBOR_OFFSETS], axis=-1).reshape(w * d, 4)
+        candidates = np.stack([flat + dy * w + dx for dx, dy in _NEIGHBOR_OFFSETS],
+                              axis=-1).reshape(w * d, 4)
+        candidates[~valid] = -1
+        
+        # Pack valid neighbors to the front of each row, keeping direction order
+        order = np.argsort(~valid, axis=1, kind='stable')
+        self._neighbor_idx = np.take_along_axis(candidates, order, axis=1)
+        self._neighbor_count = valid.sum(axis=1).astype(np.int8)
+    
+    def cell_index(self, x: int, y: int) -> int:
+        """Flat index of (x, y) used by the neighbor table"""
+        return y * self.width + x
+    
+    def neighbors_of(self, idx: int) -> np.ndarray:
+        """Flat indices of the walkable neighbors of flat cell index idx"""
+        return self._neighbor_idx[idx, :self._neighbor_count[idx]]
+    
+    @staticmethod
+    def _mask_positions(mask: np.ndarray) -> List[Tuple[int, int]]:
+        """(x, y) positions where a [y, x] mask is set, in x-major order"""
+        return [tuple(p) for p in np.argwhere(mask.T).tolist()]
+    
+    def _group_positions_by_type(self) -> Dict[CellType, List[Tuple[int, int]]]:
+        """(x, y) of every cell grouped by CellType with one stable sort, each group x-major"""
+        codes = self.layout_grid.T.ravel()  # x-major flat order
+        order = np.argsort(codes, kind='stable')
+        xs, ys = np.divmod(order, self.depth)
+        positions = list(zip(xs.tolist(), ys.tolist()))
+        
+        counts = np.bincount(codes, minlength=_CELLTYPE_MAX)
+        ends = np.cumsum(counts).tolist()
+        counts = counts.tolist()
+        return {ct: positions[ends[ct.value] - counts[ct.value]:ends[ct.value]] for ct in CellType}
+    
+    def find_positions(self, cell_type: CellType) -> List[Tuple[int, int]]:
+        """All (x, y) positions of a cell type, in the order of a nested x/y grid scan (shared list, don't modify)"""
+        return self._positions_by_type[cell_type]
     
     def get_cell_type(self, x: int, y: int) -> CellType:
         """Get the type of cell at given coordinates"""
         if 0 <= x < self.width and 0 <= y < self.depth:
-            return CellType(self.layout_grid[x, y])
+            return self._cell_types[y][x]
         return CellType.WALL
     
     def is_walkable(self, x: int, y: int) -> bool:
         """Check if a cell is walkable for workers"""
-        cell_type = self.get_cell_type(x, y)
-        walkable_types = {
-            CellType.AISLE, 
-            CellType.MAIN_HALLWAY, 
-            CellType.CROSS_AISLE,
-            CellType.ENTRANCE,
-            CellType.EXIT
-        }
-        return cell_type in walkable_types
+        return 0 <= x < self.width and 0 <= y < self.depth and bool(self._walkable[y, x])
     
     def can_place_worker(self, x: int, y: int, worker_id: str) -> bool:
         """Check if a worker can be placed at given position"""
@@ -280,54 +374,77 @@ class LargeWarehouse:
         """Place a worker at given position"""
         if self.can_place_worker(x, y, worker_id):
             self.worker_positions[(x, y)] = worker_id
+            self._worker_pos[worker_id] = (x, y)
             return True
         return False
     
     def remove_worker(self, worker_id: str) -> Optional[Tuple[int, int]]:
         """Remove worker and return their position"""
-        for pos, wid in self.worker_positions.items():
-            if wid == worker_id:
-                del self.worker_positions[pos]
-                return pos
-        return None
+        pos = self._worker_pos.pop(worker_id, None)
+        if pos is not None:
+            del self.worker_positions[pos]
+        return pos
     
     def get_storage_cell(self, x: int, y: int, level: int) -> Optional[StorageCell]:
         """Get storage cell at given coordinates and level"""
         return self.storage_cells.get((x, y, level))
     
     def place_item(self, item: Item, x: int, y: int, level: int) -> bool:
-        """Place an item in a storage cell"""
+        """Place an item in a storage cell (an item id can only be stored in one cell)"""
         cell = self.get_storage_cell(x, y, level)
-        if cell and cell.can_store_item(item):
-            return cell.add_item(item)
-        return False
+        return cell is not None and cell.add_item(item)
     
     def remove_item(self, item_id: str, x: int, y: int, level: int) -> Optional[Item]:
         """Remove an item from a storage cell"""
         cell = self.get_storage_cell(x, y, level)
-        if cell:
-            return cell.remove_item(item_id)
-        return None
+        return cell.remove_item(item_id) if cell else None
+    
+    def _register_item(self, cell: StorageCell, item: Item) -> bool:
+        """Mirror an item entering one of our cells; refuses ids already stored in another cell"""
+        if item.id in self._item_location:
+            return False
+        self._item_count += 1
+        self.space_used[self._shelf_index[(cell.x, cell.y)], cell.level - 1] += _item_space(item)
+        self._item_location[item.id] = (cell.x, cell.y, cell.level)
+        return True
+    
+    def _unregister_item(self, cell: StorageCell, item: Item) -> None:
+        """Mirror an item leaving one of our cells"""
+        self._item_count -= 1
+        self.space_used[self._shelf_index[(cell.x, cell.y)], cell.level - 1] -= _item_space(item)
+        self._item_location.pop(item.id, None)
+    
+    def can_store_item_batch(self, items: List[Item]) -> np.ndarray:
+        """
+        Feasibility of every item in every storage cell at once
+        
+        Returns a bool array of shape (len(items), shelves, levels); entry [i, s, l] says
+        whether items[i] fits in the cell at self.shelf_xy[s] on level l + 1
+        """
+        item_spaces = np.array([_item_space(item) for item in items], dtype=np.int16)
+        item_max_level = np.array([_MAX_LEVEL_FOR_WEIGHT.get(item.weight_class, _ANY_LEVEL)
+                                   for item in items], dtype=np.int64)
+        levels = np.arange(1, self.levels + 1)
+        
+        fits = self.space_used[None, :, :] + item_spaces[:, None, None] <= 4
+        allowed = levels[None, None, :] <= item_max_level[:, None, None]
+        return fits & allowed
     
     def find_item(self, item_id: str) -> Optional[Tuple[int, int, int, Item]]:
         """Find an item in the warehouse and return its location"""
-        for (x, y, level), cell in self.storage_cells.items():
-            for item in cell.current_items:
-                if item.id == item_id:
-                    return (x, y, level, item)
-        return None
+        location = self._item_location.get(item_id)
+        if location is None:
+            return None
+        item = self.storage_cells[location].current_items.get(item_id)
+        return None if item is None else (*location, item)
     
     def get_accessible_neighbors(self, x: int, y: int) -> List[Tuple[int, int]]:
         """Get walkable neighboring cells for pathfinding"""
-        neighbors = []
-        directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]  # N, S, E, W
-        
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            if self.is_walkable(nx, ny):
-                neighbors.append((nx, ny))
-        
-        return neighbors
+        if 0 <= x < self.width and 0 <= y < self.depth:
+            # Every neighbor of an in-grid cell lies inside the padded mask (offset by 1)
+            padded = self._walkable_padded
+            return [(x + dx, y + dy) for dx, dy in _NEIGHBOR_OFFSETS if padded[y + dy + 1, x + dx + 1]]
+        return [(x + dx, y + dy) for dx, dy in _NEIGHBOR_OFFSETS if self.is_walkable(x + dx, y + dy)]
     
     def manhattan_distance(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> int:
         """Calculate Manhattan distance between two positions"""
@@ -335,15 +452,15 @@ class LargeWarehouse:
     
     def get_warehouse_stats(self) -> Dict:
         """Get comprehensive warehouse statistics"""
-        total_shelf_cells = sum(1 for cell_type in self.layout_grid.flat 
-                               if cell_type == CellType.SHELF.value)
-        total_aisle_cells = sum(1 for cell_type in self.layout_grid.flat 
-                               if cell_type in [CellType.AISLE.value, 
-                                              CellType.MAIN_HALLWAY.value,
-                                              CellType.CROSS_AISLE.value])
+        counts = np.bincount(self.layout_grid.ravel(), minlength=_CELLTYPE_MAX)
+        total_shelf_cells = int(counts[CellType.SHELF.value])
+        total_aisle_cells = int(counts[CellType.AISLE.value] +
+                                counts[CellType.MAIN_HALLWAY.value] +
+                                counts[CellType.CROSS_AISLE.value])
         
         total_storage_capacity = len(self.storage_cells) * 4  # 4 small items per cell
-        current_items = sum(len(cell.current_items) for cell in self.storage_cells.values())
+        current_items = self._item_count
+        space_units = int(self.space_used.sum())
         
         stats = {
             'dimensions': f"{self.width}x{self.depth}x{self.levels}",
@@ -354,6 +471,8 @@ class LargeWarehouse:
             'total_storage_capacity': total_storage_capacity,
             'current_items': current_items,
             'occupancy_rate': current_items / total_storage_capacity if total_storage_capacity > 0 else 0,
+            'occupied_locations': int(np.count_nonzero(self.space_used)),
+            'space_utilization': space_units / total_storage_capacity if total_storage_capacity > 0 else 0,
             'entrances': len(self.entrances),
             'workers': len(self.worker_positions)
         }
@@ -362,32 +481,16 @@ class LargeWarehouse:
     
     def print_layout(self, level: Optional[int] = None):
         """Print a visual representation of the warehouse layout"""
-        symbols = {
-            CellType.WALL: '█',
-            CellType.SHELF: '▢',
-            CellType.AISLE: '·',
-            CellType.MAIN_HALLWAY: '═',
-            CellType.CROSS_AISLE: '┼',
-            CellType.ENTRANCE: 'E',
-            CellType.EXIT: 'X'
-        }
-        
         print(f"\nWarehouse Layout ({self.width}x{self.depth}):")
         print("═" * (self.width + 2))
         
-        for y in range(self.depth):
-            row = "║"
-            for x in range(self.width):
-                cell_type = CellType(self.layout_grid[x, y])
-                symbol = symbols.get(cell_type, '?')
-                
-                # Show workers
-                if (x, y) in self.worker_positions:
-                    symbol = '◉'
-                
-                row += symbol
-            row += "║"
-            print(row)
+        # Symbol grid indexed [y, x], with workers drawn over their cells
+        chars = _LAYOUT_SYMBOLS[self.layout_grid]
+        for x, y in self.worker_positions:
+            chars[y, x] = '◉'
+        
+        for row in chars:
+            print("║" + "".join(row) + "║")
         
         print("═" * (self.width + 2))
         print("Legend: ▢=Shelf, ·=Aisle, ═=Main Hallway, ┼=Cross-aisle, E=Entrance, X=Exit, ◉=Worker")
\ No newline at end of file
@@ -4,12 +4,46 @@ Comprehensive test suite for the Large Warehouse Structure
 Tests all functionality including storage, worker placement, and pathfinding
 """
 
+import io
+import os
+import tempfile
 import unittest
+from unittest import mock
 import random
+import contextlib
+import functools
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from src.warehouse.structure import (
     LargeWarehouse, Item, ItemSize, WeightClass, 
     CellType, StorageCell
 )
+from src.shared_enums import SeasonalPattern
+from src.utils.data_generator import WarehouseDataGenerator
+from src.simulation.order_generator import RealisticOrderGenerator, CATEGORY_BOOSTS, Season
+
+# Stress-test item attributes
+_SIZES = list(ItemSize)
+_WEIGHTS = list(WeightClass)
+_CATS = ("electronics", "tools", "books", "clothing")
+
+# Test-body output (stats, layouts) is only printed when WH_TEST_VERBOSE=1
+VERBOSE = os.environ.get("WH_TEST_VERBOSE", "") not in ("", "0")
+
+# The layout-printing smoke test only runs when WH_VISUAL=1
+VISUAL = os.environ.get("WH_VISUAL", "") not in ("", "0")
+
+
+def _log(*args, **kwargs):
+    """print() that is silent unless VERBOSE"""
+    if VERBOSE:
+        print(*args, **kwargs)
+
+
+@functools.lru_cache(maxsize=8)
+def _warehouse(width, depth, levels):
+    """Shared warehouse per shape for single-shot users; callers must undo their placements"""
+    return LargeWarehouse(width=width, depth=depth, levels=levels)
 
 class TestStorageCell(unittest.TestCase):
     """Test storage cell functionality"""
@@ -17,7 +51,6 @@ class TestStorageCell(unittest.TestCase):
     def setUp(self):
         """Set up test storage cell"""
         self.cell = StorageCell(
-            max_capacity={ItemSize.SMALL: 4, ItemSize.MEDIUM: 2, ItemSize.LARGE: 1},
             current_items=[],
             level=1,
             x=5,
@@ -80,16 +113,16 @@ class TestStorageCell(unittest.TestCase):
     def test_weight_restrictions(self):
         """Test weight class restrictions by level"""
         # Level 1 cell - should accept all weights
-        level1_cell = StorageCell({}, [], 1, 0, 0)
+        level1_cell = StorageCell([], 1, 0, 0)
         heavy_item = Item("HEAVY_01", ItemSize.LARGE, WeightClass.HEAVY, 15.0, "machinery")
         self.assertTrue(level1_cell.can_store_item(heavy_item))
         
         # Level 2 cell - should reject heavy items
-        level2_cell = StorageCell({}, [], 2, 0, 0)
+        level2_cell = StorageCell([], 2, 0, 0)
         self.assertFalse(level2_cell.can_store_item(heavy_item))
         
         # Level 3 cell - should reject heavy and medium items
-        level3_cell = StorageCell({}, [], 3, 0, 0)
+        level3_cell = StorageCell([], 3, 0, 0)
         medium_item = Item("MED_01", ItemSize.MEDIUM, WeightClass.MEDIUM, 5.0, "tools")
         self.assertFalse(level3_cell.can_store_item(heavy_item))
         self.assertFalse(level3_cell.can_store_item(medium_item))
@@ -131,47 +164,59 @@ class TestLargeWarehouse(unittest.TestCase):
         
         # Check that we have storage cells
         self.assertGreater(len(self.warehouse.storage_cells), 0)
-        print(f"Created warehouse with {len(self.warehouse.storage_cells)} storage cells")
+        _log(f"Created warehouse with {len(self.warehouse.storage_cells)} storage cells")
+    
+    def _cell_type_grid(self):
+        """CellType of every cell via get_cell_type, indexed [y][x] like layout_grid"""
+        wh = self.warehouse
+        return [[wh.get_cell_type(x, y) for x in range(wh.width)] for y in range(wh.depth)]
     
     def test_cell_types(self):
         """Test different cell types are created correctly"""
-        cell_types_found = set()
-        
-        for x in range(self.warehouse.width):
-            for y in range(self.warehouse.depth):
-                cell_type = self.warehouse.get_cell_type(x, y)
-                cell_types_found.add(cell_type)
+        wh = self.warehouse
+        grid = self._cell_type_grid()
+        cell_types_found = {ct for row in grid for ct in row}
         
         # Should have multiple cell types
         expected_types = {CellType.SHELF, CellType.AISLE, CellType.MAIN_HALLWAY}
         self.assertTrue(expected_types.issubset(cell_types_found))
-        print(f"Found cell types: {[ct.name for ct in cell_types_found]}")
+        
+        # get_cell_type agrees with the raw layout codes
+        codes = np.array([[ct.value for ct in row] for row in grid], dtype=wh.layout_grid.dtype)
+        np.testing.assert_array_equal(codes, wh.layout_grid)
+        
+        # find_positions matches a nested x/y scan over get_cell_type
+        for ct in CellType:
+            expected = [(x, y) for x in range(wh.width) for y in range(wh.depth) if grid[y][x] == ct]
+            self.assertEqual(wh.find_positions(ct), expected, ct.name)
+        
+        # Out-of-bounds cells read as walls
+        self.assertEqual(wh.get_cell_type(-1, 0), CellType.WALL)
+        self.assertEqual(wh.get_cell_type(wh.width, wh.depth - 1), CellType.WALL)
+        _log(f"Found cell types: {[ct.name for ct in cell_types_found]}")
     
     def test_walkable_areas(self):
         """Test that walkable areas are properly identified"""
-        walkable_count = 0
-        
-        for x in range(self.warehouse.width):
-            for y in range(self.warehouse.depth):
-                if self.warehouse.is_walkable(x, y):
-                    walkable_count += 1
-        
-        self.assertGreater(walkable_count, 0)
-        print(f"Found {walkable_count} walkable cells")
+        wh = self.warehouse
+        walkable_types = {CellType.AISLE, CellType.MAIN_HALLWAY, CellType.CROSS_AISLE,
+                          CellType.ENTRANCE, CellType.EXIT}
+        grid = self._cell_type_grid()
+        expected = [(x, y) for x in range(wh.width) for y in range(wh.depth) if grid[y][x] in walkable_types]
+        
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(wh.walkable_positions, expected)
+        for y in range(wh.depth):
+            for x in range(wh.width):
+                self.assertEqual(wh.is_walkable(x, y), grid[y][x] in walkable_types, (x, y))
+        self.assertFalse(wh.is_walkable(-1, 0))
+        self.assertFalse(wh.is_walkable(0, wh.depth))
+        _log(f"Found {len(expected)} walkable cells")
     
     def test_worker_placement(self):
         """Test worker placement and movement"""
         # Find a walkable position
-        walkable_pos = None
-        for x in range(self.warehouse.width):
-            for y in range(self.warehouse.depth):
-                if self.warehouse.is_walkable(x, y):
-                    walkable_pos = (x, y)
-                    break
-            if walkable_pos:
-                break
-        
-        self.assertIsNotNone(walkable_pos)
+        self.assertGreater(len(self.warehouse.walkable_positions), 0)
+        walkable_pos = self.warehouse.walkable_positions[0]
         
         # Place worker
         worker_id = "WORKER_01"
@@ -187,16 +232,8 @@ class TestLargeWarehouse(unittest.TestCase):
     def test_item_placement_and_retrieval(self):
         """Test item storage and retrieval"""
         # Find a shelf cell
-        shelf_pos = None
-        for x in range(self.warehouse.width):
-            for y in range(self.warehouse.depth):
-                if self.warehouse.get_cell_type(x, y) == CellType.SHELF:
-                    shelf_pos = (x, y)
-                    break
-            if shelf_pos:
-                break
-        
-        self.assertIsNotNone(shelf_pos)
+        self.assertGreater(len(self.warehouse.shelf_positions), 0)
+        shelf_pos = self.warehouse.shelf_positions[0]
         
         # Create test item
         test_item = Item("TEST_ITEM_01", ItemSize.SMALL, WeightClass.LIGHT, 5.0, "test_category")
@@ -221,19 +258,67 @@ class TestLargeWarehouse(unittest.TestCase):
         not_found = self.warehouse.find_item("TEST_ITEM_01")
         self.assertIsNone(not_found)
     
+    def test_changes_through_storage_cell(self):
+        """Test adding/removing via a StorageCell keeps warehouse lookups and stats in step"""
+        (x, y), (other_x, other_y) = self.warehouse.shelf_positions[:2]
+        cell = self.warehouse.get_storage_cell(x, y, 1)
+        test_item = Item("CELL_ITEM_01", ItemSize.MEDIUM, WeightClass.LIGHT, 2.0, "test_category")
+        filler = Item("CELL_ITEM_02", ItemSize.MEDIUM, WeightClass.LIGHT, 2.0, "test_category")
+        
+        self.assertTrue(cell.add_item(test_item))
+        self.assertTrue(cell.add_item(filler))
+        self.assertEqual(self.warehouse.get_warehouse_stats()['current_items'], 2)
+        self.assertEqual(self.warehouse.find_item("CELL_ITEM_01")[:3], (x, y, 1))
+        
+        # Same id can't also go into another cell through that cell
+        self.assertFalse(self.warehouse.get_storage_cell(other_x, other_y, 1).add_item(test_item))
+        
+        # Batch feasibility sees the now-full cell
+        probe = Item("PROBE_01", ItemSize.SMALL, WeightClass.LIGHT, 1.0, "test_category")
+        feasible = self.warehouse.can_store_item_batch([probe])
+        self.assertFalse(feasible[0, 0, 0])
+        self.assertEqual(feasible[0, 0, 0], cell.can_store_item(probe))
+        
+        self.assertIs(cell.remove_item("CELL_ITEM_01"), test_item)
+        self.assertIsNone(self.warehouse.find_item("CELL_ITEM_01"))
+        self.assertEqual(self.warehouse.get_warehouse_stats()['current_items'], 1)
+        self.assertTrue(self.warehouse.can_store_item_batch([probe])[0, 0, 0])
+    
+    def test_duplicate_item_placement(self):
+        """Test an item id already stored elsewhere is rejected"""
+        first_pos, second_pos = self.warehouse.shelf_positions[:2]
+        test_item = Item("TEST_ITEM_02", ItemSize.SMALL, WeightClass.LIGHT, 5.0, "test_category")
+        
+        self.assertTrue(self.warehouse.place_item(test_item, first_pos[0], first_pos[1], 1))
+        self.assertFalse(self.warehouse.place_item(test_item, second_pos[0], second_pos[1], 1))
+        self.assertIsNone(self.warehouse.remove_item("TEST_ITEM_02", second_pos[0], second_pos[1], 1))
+        self.assertEqual(self.warehouse.find_item("TEST_ITEM_02")[:3], (first_pos[0], first_pos[1], 1))
+    
+    def test_batch_storage_feasibility(self):
+        """Test batch feasibility matches per-cell can_store_item"""
+        shelf_x, shelf_y = (int(v) for v in self.warehouse.shelf_xy[0])
+        self.assertTrue(self.warehouse.place_item(
+            Item("FILLER_01", ItemSize.MEDIUM, WeightClass.LIGHT, 1.0, "test_category"), shelf_x, shelf_y, 1))
+        
+        items = [
+            Item("BATCH_01", ItemSize.SMALL, WeightClass.LIGHT, 1.0, "test_category"),
+            Item("BATCH_02", ItemSize.LARGE, WeightClass.HEAVY, 1.0, "test_category"),
+            Item("BATCH_03", ItemSize.MEDIUM, WeightClass.MEDIUM, 1.0, "test_category")
+        ]
+        feasible = self.warehouse.can_store_item_batch(items)
+        self.assertEqual(feasible.shape, (len(items), len(self.warehouse.shelf_xy), self.warehouse.levels))
+        
+        for i, item in enumerate(items):
+            for s, (x, y) in enumerate(self.warehouse.shelf_xy.tolist()):
+                for level in range(1, self.warehouse.levels + 1):
+                    cell = self.warehouse.get_storage_cell(x, y, level)
+                    self.assertEqual(feasible[i, s, level - 1], cell.can_store_item(item))
+    
     def test_pathfinding_neighbors(self):
         """Test neighbor finding for pathfinding"""
         # Find an aisle position
-        aisle_pos = None
-        for x in range(self.warehouse.width):
-            for y in range(self.warehouse.depth):
-                if self.warehouse.get_cell_type(x, y) == CellType.AISLE:
-                    aisle_pos = (x, y)
-                    break
-            if aisle_pos:
-                break
-        
-        self.assertIsNotNone(aisle_pos)
+        self.assertGreater(len(self.warehouse.aisle_positions), 0)
+        aisle_pos = self.warehouse.aisle_positions[0]
         
         neighbors = self.warehouse.get_accessible_neighbors(aisle_pos[0], aisle_pos[1])
         self.assertGreater(len(neighbors), 0)
@@ -242,6 +327,25 @@ class TestLargeWarehouse(unittest.TestCase):
         for nx, ny in neighbors:
             self.assertTrue(self.warehouse.is_walkable(nx, ny))
     
+    def test_neighbor_table(self):
+        """Test the flat neighbor table against get_accessible_neighbors"""
+        # Non-square so swapped x/y or width/depth in the flat index would show up
+        wh = _warehouse(23, 17, 2)
+        self.assertEqual(wh._neighbor_idx.shape, (wh.width * wh.depth, 4))
+        
+        for y in range(wh.depth):
+            for x in range(wh.width):
+                idx = wh.cell_index(x, y)
+                self.assertEqual(idx, y * wh.width + x)
+                expected = [wh.cell_index(nx, ny) for nx, ny in wh.get_accessible_neighbors(x, y)]
+                self.assertEqual(wh.neighbors_of(idx).tolist(), expected, (x, y))
+                
+                # Count matches a direct is_walkable scan, and the unused slots are padding
+                walkable = sum(wh.is_walkable(x + dx, y + dy) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)))
+                count = int(wh._neighbor_count[idx])
+                self.assertEqual(count, walkable, (x, y))
+                self.assertTrue((wh._neighbor_idx[idx, count:] == -1).all(), (x, y))
+    
     def test_warehouse_statistics(self):
         """Test warehouse statistics generation"""
         stats = self.warehouse.get_warehouse_stats()
@@ -261,16 +365,25 @@ class TestLargeWarehouse(unittest.TestCase):
         self.assertGreater(stats['storage_locations'], 0)
         self.assertEqual(stats['entrances'], 2)
         
-        print(f"Warehouse Statistics:")
+        _log(f"Warehouse Statistics:")
         for key, value in stats.items():
-            print(f"  {key}: {value}")
+            _log(f"  {key}: {value}")
 
 
 class TestWarehouseStressTest(unittest.TestCase):
     """Stress tests for large warehouse operations"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the large warehouse once, shared by the read-only tests"""
+        cls.shared_warehouse = LargeWarehouse(width=36, depth=36, levels=3)
+    
     def setUp(self):
         """Set up large warehouse for stress testing"""
+        self.warehouse = self.shared_warehouse
+    
+    def _fresh_warehouse(self):
+        """Private warehouse for tests that place items or workers (rebuilding beats deepcopy)"""
         self.warehouse = LargeWarehouse(width=36, depth=36, levels=3)
     
     def test_large_warehouse_creation(self):
@@ -280,84 +393,100 @@ class TestWarehouseStressTest(unittest.TestCase):
         self.assertEqual(self.warehouse.levels, 3)
         
         stats = self.warehouse.get_warehouse_stats()
-        print(f"\nLarge Warehouse Created:")
-        print(f"  Total cells: {stats['total_cells']}")
-        print(f"  Storage locations: {stats['storage_locations']}")
-        print(f"  Storage capacity: {stats['total_storage_capacity']} items")
+        _log(f"\nLarge Warehouse Created:")
+        _log(f"  Total cells: {stats['total_cells']}")
+        _log(f"  Storage locations: {stats['storage_locations']}")
+        _log(f"  Storage capacity: {stats['total_storage_capacity']} items")
     
     def test_massive_item_placement(self):
         """Test placing many items throughout warehouse"""
+        self._fresh_warehouse()
         items_placed = 0
         max_items_to_place = 100
         
-        # Generate test items
-        test_items = []
-        for i in range(max_items_to_place):
-            size = random.choice(list(ItemSize))
-            weight = random.choice(list(WeightClass))
-            item = Item(
+        # Seeded here so the run doesn't depend on which tests ran before
+        rng = random.Random(0)
+        
+        # Generate test item attributes in one batch each, then build the items
+        attr_rng = np.random.default_rng(0)
+        sizes = attr_rng.integers(0, len(_SIZES), max_items_to_place)
+        weights = attr_rng.integers(0, len(_WEIGHTS), max_items_to_place)
+        picks = attr_rng.uniform(0.5, 20.0, max_items_to_place).tolist()
+        cats = attr_rng.integers(0, len(_CATS), max_items_to_place)
+        
+        test_items = [
+            Item(
                 id=f"STRESS_ITEM_{i:03d}",
-                size=size,
-                weight_class=weight,
-                daily_picks=random.uniform(0.5, 20.0),
-                category=random.choice(["electronics", "tools", "books", "clothing"])
+                size=_SIZES[sizes[i]],
+                weight_class=_WEIGHTS[weights[i]],
+                daily_picks=picks[i],
+                category=_CATS[cats[i]]
             )
-            test_items.append(item)
+            for i in range(max_items_to_place)
+        ]
         
         # Try to place items in random valid locations
-        shelf_positions = []
-        for x in range(self.warehouse.width):
-            for y in range(self.warehouse.depth):
-                if self.warehouse.get_cell_type(x, y) == CellType.SHELF:
-                    shelf_positions.append((x, y))
+        shelf_positions = self.warehouse.shelf_positions
+        
+        # Placements as parallel arrays, filled up to items_placed, plus an id lookup
+        placed_ids = np.empty(max_items_to_place, dtype=object)
+        placed_xs = np.empty(max_items_to_place, dtype=np.int16)
+        placed_ys = np.empty_like(placed_xs)
+        placed_levels = np.empty(max_items_to_place, dtype=np.int8)
+        loc_by_id = {}  # item id -> (x, y, level) it was placed at
         
+        attempts = min(20, len(shelf_positions))
         for item in test_items:
-            placed = False
-            attempts = 0
-            while not placed and attempts < 20:  # Try up to 20 random positions
-                pos = random.choice(shelf_positions)
-                level = random.randint(1, self.warehouse.levels)
+            # Try up to 20 distinct random positions
+            for pos in rng.sample(shelf_positions, k=attempts):
+                level = rng.randint(1, self.warehouse.levels)
                 
                 if self.warehouse.place_item(item, pos[0], pos[1], level):
+                    placed_ids[items_placed] = item.id
+                    placed_xs[items_placed], placed_ys[items_placed] = pos
+                    placed_levels[items_placed] = level
                     items_placed += 1
-                    placed = True
-                attempts += 1
+                    loc_by_id[item.id] = (pos[0], pos[1], level)
+                    break
         
-        print(f"Successfully placed {items_placed}/{max_items_to_place} items")
+        _log(f"Successfully placed {items_placed}/{max_items_to_place} items")
         self.assertGreater(items_placed, 0)
         
-        # Verify we can find all placed items
-        found_items = 0
-        for item in test_items[:items_placed]:
-            if self.warehouse.find_item(item.id) is not None:
-                found_items += 1
+        # Check each placement against the storage cell that should hold it
+        self.assertEqual(len(loc_by_id), items_placed)
         
+        found_items = sum(item_id in self.warehouse.get_storage_cell(x, y, level).current_items
+                          for item_id, x, y, level in zip(placed_ids[:items_placed].tolist(),
+                                                          placed_xs[:items_placed].tolist(),
+                                                          placed_ys[:items_placed].tolist(),
+                                                          placed_levels[:items_placed].tolist()))
         self.assertEqual(found_items, items_placed)
-        print(f"Successfully found all {found_items} placed items")
+        
+        # One sampled find_item call keeps the public lookup covered
+        sample_id = rng.choice(list(loc_by_id))
+        self.assertEqual(self.warehouse.find_item(sample_id)[:3], loc_by_id[sample_id])
+        _log(f"Successfully found all {found_items} placed items")
     
     def test_multiple_workers(self):
         """Test placing multiple workers"""
+        self._fresh_warehouse()
         workers_placed = 0
         max_workers = 10
         
         # Find walkable positions
-        walkable_positions = []
-        for x in range(self.warehouse.width):
-            for y in range(self.warehouse.depth):
-                if self.warehouse.is_walkable(x, y):
-                    walkable_positions.append((x, y))
+        walkable_positions = self.warehouse.walkable_positions
         
-        print(f"Found {len(walkable_positions)} walkable positions")
+        _log(f"Found {len(walkable_positions)} walkable positions")
         
-        # Place workers
-        for i in range(min(max_workers, len(walkable_positions))):
-            pos = walkable_positions[i]
-            worker_id = f"WORKER_{i:02d}"
+        # Place workers on the first max_workers walkable cells only
+        worker_positions = walkable_positions[:max_workers]
+        worker_ids = [f"WORKER_{i:02d}" for i in range(len(worker_positions))]
+        for worker_id, pos in zip(worker_ids, worker_positions):
             if self.warehouse.place_worker(pos[0], pos[1], worker_id):
                 workers_placed += 1
         
-        print(f"Placed {workers_placed} workers")
-        self.assertEqual(workers_placed, min(max_workers, len(walkable_positions)))
+        _log(f"Placed {workers_placed} workers")
+        self.assertEqual(workers_placed, len(worker_positions))
         
         # Verify worker positions
         self.assertEqual(len(self.warehouse.worker_positions), workers_placed)
@@ -370,16 +499,18 @@ class TestWarehouseStressTest(unittest.TestCase):
         # Find positions in different zones
         test_positions = []
         zones_tested = set()
+        zone_count = -(-self.warehouse.width // 10) * -(-self.warehouse.depth // 10)
         
-        for x in range(0, self.warehouse.width, 5):
-            for y in range(0, self.warehouse.depth, 5):
-                if self.warehouse.is_walkable(x, y):
-                    zone = f"zone_{x//10}_{y//10}"
-                    if zone not in zones_tested:
-                        test_positions.append((x, y))
-                        zones_tested.add(zone)
+        for x, y in self.warehouse.walkable_positions:
+            if x % 5 == 0 and y % 5 == 0:
+                zone = (x // 10, y // 10)
+                if zone not in zones_tested:
+                    test_positions.append((x, y))
+                    zones_tested.add(zone)
+                    if len(zones_tested) == zone_count:
+                        break  # Every 10x10 zone already has a test position
         
-        print(f"Testing connectivity from entrance {entrance} to {len(test_positions)} positions")
+        _log(f"Testing connectivity from entrance {entrance} to {len(test_positions)} positions")
         
         # For each position, check if we can find neighbors (basic connectivity test)
         connected_positions = 0
@@ -388,16 +519,17 @@ class TestWarehouseStressTest(unittest.TestCase):
             if len(neighbors) > 0:
                 connected_positions += 1
         
-        print(f"Found {connected_positions}/{len(test_positions)} connected positions")
+        _log(f"Found {connected_positions}/{len(test_positions)} connected positions")
         self.assertGreater(connected_positions, 0)
 
 
 class TestWarehouseVisualization(unittest.TestCase):
     """Test warehouse visualization and layout printing"""
     
+    @unittest.skipUnless(VISUAL, "visual test, set WH_VISUAL=1 to run")
     def test_layout_printing(self):
         """Test warehouse layout visualization"""
-        warehouse = LargeWarehouse(width=20, depth=15, levels=2)
+        warehouse = _warehouse(20, 15, 2)
         
         print("\n" + "="*50)
         print("WAREHOUSE LAYOUT VISUALIZATION TEST")
@@ -407,19 +539,12 @@ class TestWarehouseVisualization(unittest.TestCase):
         warehouse.print_layout()
         
         # Place some workers and show updated layout
-        walkable_pos = []
-        for x in range(warehouse.width):
-            for y in range(warehouse.depth):
-                if warehouse.is_walkable(x, y):
-                    walkable_pos.append((x, y))
-                if len(walkable_pos) >= 3:
-                    break
-            if len(walkable_pos) >= 3:
-                break
+        walkable_pos = warehouse.walkable_positions[:3]
         
         # Place workers
         for i, pos in enumerate(walkable_pos[:3]):
             warehouse.place_worker(pos[0], pos[1], f"WORKER_{i}")
+            self.addCleanup(warehouse.remove_worker, f"WORKER_{i}")
         
         print(f"\nLayout with {len(walkable_pos[:3])} workers placed:")
         warehouse.print_layout()
@@ -431,34 +556,151 @@ class TestWarehouseVisualization(unittest.TestCase):
             print(f"  {key}: {value}")
 
 
+class TestDataGenerator(unittest.TestCase):
+    """Test item catalog generation and persistence"""
+    
+    def test_json_round_trip(self):
+        """Items saved to JSON load back equal, in the same order"""
+        generator = WarehouseDataGenerator(random_seed=7)
+        items = generator.generate_items(50)
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "items.json")
+            generator.save_items_to_json(path)
+            loaded = WarehouseDataGenerator().load_items_from_json(path)
+        
+        self.assertEqual(loaded, items)
+    
+    def test_queries_before_generation(self):
+        """A fresh generator answers queries with empty results"""
+        generator = WarehouseDataGenerator()
+        self.assertEqual(generator.get_high_frequency_items(), [])
+        self.assertEqual(generator.get_seasonal_items(), [])
+        self.assertEqual(generator.compute_monthly_demand_matrix().shape, (0, 12))
+    
+    def test_monthly_picks_month_range(self):
+        """Every seasonal pattern accepts months 1-12 and rejects anything else"""
+        generator = WarehouseDataGenerator(random_seed=3)
+        items = generator.generate_items(200)
+        demand = generator.compute_monthly_demand_matrix()
+        self.assertEqual({item.seasonal_pattern for item in items}, set(SeasonalPattern))
+        
+        for row, item in zip(demand, items):
+            picks = [item.get_daily_picks_for_month(month) for month in range(1, 13)]
+            np.testing.assert_allclose(picks, row)
+            for month in (0, -1, 13):
+                with self.assertRaises(ValueError):
+                    item.get_daily_picks_for_month(month)
+
+
+class TestOrderGenerator(unittest.TestCase):
+    """Test seeded order generation and item pool weighting"""
+    
+    def setUp(self):
+        """Set up a seeded catalog of placed items"""
+        rng = random.Random(11)
+        # 'toys' has no category boost, so the 1.0 default is covered too
+        categories = list(CATEGORY_BOOSTS) + ['toys']
+        self.items = [
+            {
+                'item_id': f"ITEM_{i+1:03d}",
+                'item_name': f"Test Item {i+1}",
+                'size': rng.choice(_SIZES),
+                'weight_class': rng.choice(_WEIGHTS),
+                'category': rng.choice(categories),
+                'daily_picks': rng.uniform(1.0, 20.0),
+                'seasonal_pattern': rng.choice(list(SeasonalPattern)),
+                'location': (rng.randint(1, 30), rng.randint(1, 30), rng.randint(1, 3)),
+                'pick_time': rng.uniform(15, 45)
+            }
+            for i in range(60)
+        ]
+        self.generator = RealisticOrderGenerator(self.items, random_seed=42)
+    
+    def test_order_draws_within_pattern_limits(self):
+        """Drawn item counts stay within each customer type's range, priorities within 1-3"""
+        gen = self.generator
+        with mock.patch.object(gen, '_generate_single_order', wraps=gen._generate_single_order) as single:
+            orders = gen.generate_daily_orders(num_orders=300, day_of_week=6)
+        
+        self.assertEqual(single.call_count, 300)
+        for call in single.call_args_list:
+            pattern = gen.order_patterns[call.kwargs['customer_type']]
+            self.assertGreaterEqual(call.kwargs['num_items'], pattern.min_items)
+            self.assertLessEqual(call.kwargs['num_items'], pattern.max_items)
+            self.assertIn(call.kwargs['priority'], (1, 2, 3))
+        
+        # Built orders never exceed the drawn count (the load cap may cut them short)
+        self.assertGreater(len(orders), 0)
+        for order in orders:
+            self.assertIn(order.priority, (1, 2, 3))
+            self.assertGreaterEqual(len(order.items), 1)
+            self.assertLessEqual(len(order.items), max(p.max_items for p in gen.order_patterns.values()))
+    
+    def test_pool_weights_match_scalar_formula(self):
+        """Vectorized pool weights equal the per-item seasonal demand formula"""
+        gen = self.generator
+        for season in (Season.WINTER, Season.SPRING, Season.SUMMER, Season.AUTUMN):
+            gen.set_season(season)
+            weights = gen._compute_pool_weights()
+            
+            for row, customer_type in enumerate(gen._customer_types):
+                pattern = gen.order_patterns[customer_type]
+                expected = []
+                for item in self.items:
+                    demand = gen.calculate_seasonal_demand(item)
+                    weight = demand * pattern.size_preference.get(item['size'], 0.1)
+                    if demand > 10:
+                        weight *= 1.5
+                    weight *= CATEGORY_BOOSTS.get(item['category'], 1.0)
+                    expected.append(max(weight, 0.1))
+                np.testing.assert_allclose(weights[row], expected, err_msg=f"{customer_type}, season {season}")
+
+
+def _run_test_class(class_name):
+    """Run one TestCase class, returning (tests run, failures + errors, captured output)"""
+    output = io.StringIO()
+    
+    # Warehouse construction chatter is dropped too unless VERBOSE (or VISUAL, to keep the layouts)
+    with contextlib.redirect_stdout(output if VERBOSE or VISUAL else io.StringIO()):
+        suite = unittest.TestLoader().loadTestsFromTestCase(globals()[class_name])
+        result = unittest.TextTestRunner(stream=output, verbosity=2 if VERBOSE else 1).run(suite)
+    return result.testsRun, len(result.failures) + len(result.errors), output.getvalue()
+
+
 def run_comprehensive_tests():
     """Run all tests with detailed output"""
     print("="*60)
     print("COMPREHENSIVE WAREHOUSE STRUCTURE TESTS")
     print("="*60)
     
-    # Test suites
+    # Test suites (each builds its own warehouses, so they can run in separate processes)
     test_suites = [
         TestStorageCell,
         TestLargeWarehouse, 
         TestWarehouseStressTest,
-        TestWarehouseVisualization
+        TestWarehouseVisualization,
+        TestDataGenerator,
+        TestOrderGenerator
     ]
     
     total_tests = 0
     total_failures = 0
     
-    for test_class in test_suites:
-        print(f"\n{'='*40}")
-        print(f"Running {test_class.__name__}")
-        print(f"{'='*40}")
-        
-        suite = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        runner = unittest.TextTestRunner(verbosity=2)
-        result = runner.run(suite)
-        
-        total_tests += result.testsRun
-        total_failures += len(result.failures) + len(result.errors)
+    # Leave a couple of cores free for the rest of the machine
+    max_workers = min(len(test_suites), max(1, (os.cpu_count() or 1) - 2))
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        results = pool.map(_run_test_class, [test_class.__name__ for test_class in test_suites])
+        
+        # Report in suite order as each shard finishes
+        for test_class, (tests_run, failures, output) in zip(test_suites, results):
+            print(f"\n{'='*40}")
+            print(f"Running {test_class.__name__}")
+            print(f"{'='*40}")
+            print(output, end="")
+            
+            total_tests += tests_run
+            total_failures += failures
     
     print(f"\n{'='*60}")
     print(f"FINAL RESULTS: {total_tests - total_failures}/{total_tests} tests passed")
@@ -475,8 +717,8 @@ def demo_warehouse_capabilities():
     print("WAREHOUSE CAPABILITIES DEMONSTRATION")
     print("="*60)
     
-    # Create large warehouse
-    warehouse = LargeWarehouse(width=30, depth=30, levels=3)
+    # Create large warehouse (cached, so it is emptied again at the end)
+    warehouse = _warehouse(30, 30, 3)
     
     # Create sample items
     sample_items = [
@@ -491,8 +733,8 @@ def demo_warehouse_capabilities():
     
     # Place items strategically
     placed_items = []
-    shelf_cells = [(x, y) for x in range(warehouse.width) for y in range(warehouse.depth) 
-                   if warehouse.get_cell_type(x, y) == CellType.SHELF]
+    placed_ids = set()
+    shelf_cells = warehouse.shelf_positions
     
     for item in sample_items:
         for pos in shelf_cells[:10]:  # Try first 10 shelf positions
@@ -501,8 +743,9 @@ def demo_warehouse_capabilities():
             for level in range(1, max_level + 1):
                 if warehouse.place_item(item, pos[0], pos[1], level):
                     placed_items.append((item, pos[0], pos[1], level))
+                    placed_ids.add(item.id)
                     break
-            if item in [p[0] for p in placed_items]:
+            if item.id in placed_ids:
                 break
     
     print(f"Placed {len(placed_items)} items in warehouse:")
@@ -510,8 +753,7 @@ def demo_warehouse_capabilities():
         print(f"  {item.id} ({item.size.value}, {item.weight_class.value}) -> ({x},{y}) Level {level}")
     
     # Place workers
-    walkable_positions = [(x, y) for x in range(warehouse.width) for y in range(warehouse.depth)
-                         if warehouse.is_walkable(x, y)]
+    walkable_positions = warehouse.walkable_positions
     
     workers = ["PICKER_A", "PICKER_B"]
     for i, worker_id in enumerate(workers):
@@ -538,6 +780,12 @@ def demo_warehouse_capabilities():
         
         retrieved = warehouse.remove_item(item.id, x, y, level)
         print(f"  Retrieved: {retrieved.id if retrieved else 'Failed'}")
+    
+    # Reset the cached warehouse for the next run
+    for item, x, y, level in placed_items:
+        warehouse.remove_item(item.id, x, y, level)
+    for worker_id in workers:
+        warehouse.remove_worker(worker_id)
 
 
 if __name__ == "__main__":